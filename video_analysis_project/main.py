@@ -1,18 +1,28 @@
 import os
 import sys
+import copy
 import yaml
 import logging
+import queue
+import functools
+import threading
+import multiprocessing as mp
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 from tqdm import tqdm
 
+# Parser YAML em C (libyaml), com fallback para o parser em Python
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Importar módulos locais
-from utils.video_processor import VideoProcessor
+from utils.video_processor import VideoProcessor, SceneChangeDetector
 from utils.report_generator import ReportGenerator
-from models.human_analyzer import HumanAnalyzer
-from models.object_detector import ObjectDetector
-from models.animal_detector import AnimalDetector
-from models.behavior_analyzer import BehaviorAnalyzer
-from models.environment_analyzer import EnvironmentAnalyzer
+# Os analisadores são importados sob demanda em initialize_analyzers
 
 # Importação condicional do analisador médico
 try:
@@ -22,6 +32,13 @@ except ImportError:
     MEDICAL_ANALYZER_AVAILABLE = False
     print("⚠️ MedicalAnalyzer não disponível")
 
+# Pool de processos de análise (opcional)
+try:
+    from utils.analyzer_workers import AnalyzerPool, AnalyzerPoolError
+    ANALYZER_POOL_AVAILABLE = True
+except ImportError:
+    ANALYZER_POOL_AVAILABLE = False
+
 # Importação condicional do gerenciador de visualização
 try:
     from utils.visualization import VisualizationManager
@@ -30,23 +47,41 @@ except ImportError:
     VISUALIZATION_AVAILABLE = False
     print("⚠️ VisualizationManager não disponível")
 
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(config_path, mtime_ns):
+    """Lê e interpreta o YAML; mtime_ns na chave invalida o cache quando o arquivo muda"""
+    with open(config_path, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=YamlLoader)
+
 class VideoAnalysisSystem:
-    def __init__(self, config_path="config/config.yaml"):
+    def __init__(self, config_path="config/config.yaml", config=None):
         """Inicializa o sistema de análise de vídeo"""
         print("🚀 Inicializando Sistema de Análise de Vídeo...")
-        self.config = self.load_config(config_path)
+        self.config = config if config is not None else self.load_config(config_path)
         self.setup_logging()
         self.setup_directories()
-        self.initialize_analyzers()
+        self.report_generator = ReportGenerator(self.config)
+        
+        # Recursos criados por initialize_analyzers; vazios até lá
+        self.analyzers_initialized = False
+        self.analyzer_pool = None
+        self.visualization_manager = None
+        self._save_queue = None
+        self._save_threads = []
+        
+        # Com vídeos em paralelo, os analisadores são carregados apenas nos processos trabalhadores
+        if int(self.config['video'].get('parallel_videos', 1)) <= 1:
+            self.initialize_analyzers()
         print("✅ Sistema inicializado com sucesso!")
         
     def load_config(self, config_path):
         """Carrega configurações do arquivo YAML"""
         try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                print(f"✓ Configurações carregadas de: {config_path}")
-                return config
+            mtime_ns = os.stat(config_path).st_mtime_ns
+            # Cópia para que alterações de uma instância não afetem o cache
+            config = copy.deepcopy(_parse_config_file(str(config_path), mtime_ns))
+            print(f"✓ Configurações carregadas de: {config_path}")
+            return config
         except FileNotFoundError:
             print(f"❌ Arquivo de configuração não encontrado: {config_path}")
             print("📝 Usando configurações padrão...")
@@ -62,7 +97,14 @@ class VideoAnalysisSystem:
                 'input_path': 'videos/input/',
                 'output_path': 'output/',
                 'supported_formats': ['.mp4', '.avi', '.mov', '.mkv', '.wmv'],
-                'frame_skip': 1
+                'frame_skip': 1,
+                'adaptive_skip': False,
+                'adaptive_max_skip': 30,
+                'prefetch_frames': True,
+                'decoder': 'simulated',
+                'hardware_decode': False,
+                'parallel_videos': 1,
+                'parallel_gpu_ids': []
             },
             'analysis': {
                 'human_detection': True,
@@ -72,12 +114,22 @@ class VideoAnalysisSystem:
                 'object_detection': True,
                 'animal_detection': True,
                 'environment_analysis': True,
-                'medical_analysis': True
+                'medical_analysis': True,
+                'batch_size': 8,
+                'reuse_stable_frames': False,
+                'scene_change_threshold': 0.02,
+                'max_reused_frames': 30,
+                'worker_processes': False,
+                'worker_start_method': 'spawn'
             },
             'output': {
                 'generate_report': True,
                 'save_frames': True,
+                'save_workers': 4,
+                'frames_format': 'images',
+                'video_codec': 'mp4v',
                 'create_visualizations': True,
+                'visualization_workers': 1,
                 'detailed_logging': True
             },
             'medical_settings': {
@@ -126,22 +178,58 @@ class VideoAnalysisSystem:
         """Inicializa todos os analisadores"""
         print("🔧 Inicializando analisadores...")
         
-        # Analisadores básicos
+        analysis_config = self.config['analysis']
         self.video_processor = VideoProcessor(self.config)
-        self.human_analyzer = HumanAnalyzer(self.config)
-        self.object_detector = ObjectDetector(self.config)
-        self.animal_detector = AnimalDetector(self.config)
-        self.behavior_analyzer = BehaviorAnalyzer(self.config)
-        self.environment_analyzer = EnvironmentAnalyzer(self.config)
-        self.report_generator = ReportGenerator(self.config)
         
-        # Analisador médico (se disponível)
-        if MEDICAL_ANALYZER_AVAILABLE:
-            self.medical_analyzer = MedicalAnalyzer(self.config)
-        else:
-            self.medical_analyzer = None
+        # Análise comportamental usa o histórico do vídeo; sempre no processo principal
+        self.behavior_analyzer = None
+        if analysis_config['behavior_analysis']:
+            from models.behavior_analyzer import BehaviorAnalyzer
+            self.behavior_analyzer = BehaviorAnalyzer(self.config)
+        
+        if not MEDICAL_ANALYZER_AVAILABLE:
             print("⚠️ Analisador médico não disponível")
         
+        # Reduzido a cada falta de memória; mantido entre os vídeos
+        self.batch_size = max(1, int(analysis_config.get('batch_size', 8)))
+        
+        # Categorias resolvidas uma única vez; consultadas a cada vídeo
+        self.enabled_categories = self.get_enabled_categories()
+        
+        # Processos persistentes por analisador (se configurado)
+        self.analyzer_pool = None
+        if analysis_config.get('worker_processes', False):
+            if ANALYZER_POOL_AVAILABLE:
+                self.analyzer_pool = AnalyzerPool(self.config, self.enabled_categories)
+                print(f"✓ Pool de análise com {len(self.enabled_categories)} processos")
+            else:
+                print("⚠️ Pool de análise não disponível, executando no processo principal")
+        
+        # Com o pool, os modelos vivem apenas nos processos de análise
+        self.human_analyzer = None
+        self.object_detector = None
+        self.animal_detector = None
+        self.environment_analyzer = None
+        self.medical_analyzer = None
+        self.enabled_analyzers = []
+        if self.analyzer_pool is None:
+            self.load_batch_analyzers()
+        
+        # Threads de gravação dos frames anotados (codificação e disco fora do laço de análise)
+        self._save_queue = None
+        self._save_threads = []
+        if self.config['output']['save_frames']:
+            self._save_queue = queue.Queue(maxsize=64)
+            save_workers = max(1, int(self.config['output'].get('save_workers', 4)))
+            # Um único vídeo anotado exige os frames em ordem, de uma só thread
+            if self.config['output'].get('frames_format', 'images') == 'video':
+                save_workers = 1
+            for worker_index in range(save_workers):
+                thread = threading.Thread(target=self._save_worker, name=f"FrameSaver-{worker_index}",
+                                          daemon=True)
+                thread.start()
+                self._save_threads.append(thread)
+        
         # Gerenciador de visualização (se disponível)
         if VISUALIZATION_AVAILABLE:
             self.visualization_manager = VisualizationManager(self.config)
@@ -149,6 +237,7 @@ class VideoAnalysisSystem:
             self.visualization_manager = None
             print("⚠️ Gerenciador de visualização não disponível")
         
+        self.analyzers_initialized = True
         print("✅ Todos os analisadores inicializados")
         
     def get_video_files(self):
@@ -161,15 +250,16 @@ class VideoAnalysisSystem:
             input_path.mkdir(parents=True, exist_ok=True)
             return []
         
-        video_files = []
-        for format_ext in supported_formats:
-            found_files = list(input_path.glob(f"*{format_ext}"))
-            video_files.extend(found_files)
-            if found_files:
-                self.logger.info(f"Encontrados {len(found_files)} arquivos {format_ext}")
+        # Uma única listagem do diretório, filtrando as extensões em memória
+        extensions = tuple(format_ext.lower() for format_ext in supported_formats)
+        with os.scandir(input_path) as entries:
+            video_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(extensions) and entry.is_file()
+            )
         
-        # Remover duplicatas e ordenar
-        video_files = sorted(list(set(video_files)))
+        if video_files:
+            self.logger.info(f"Encontrados {len(video_files)} arquivos de vídeo")
         
         return video_files
     
@@ -201,64 +291,97 @@ class VideoAnalysisSystem:
             
             # Processamento do vídeo
             print(f"📹 Processando vídeo: {video_path.name}")
-            frames = self.video_processor.extract_frames(video_path)
             analysis_results['video_info'] = self.video_processor.get_video_info(video_path)
             
-            total_frames = len(frames)
-            print(f"✓ Extraídos {total_frames} frames para análise")
-            self.logger.info(f"Extraídos {total_frames} frames de {video_path.name}")
+            # Análises em lotes de frames
+            print("🔍 Executando análises frame por frame...")
+            analysis_config = self.config['analysis']
+            # Tamanho aprendido com faltas de memória em vídeos anteriores
+            batch_size = self.batch_size
+            total_frames = 0
+            fps = float(analysis_results['video_info'].get('fps') or 30.0)
             
-            if total_frames == 0:
-                self.logger.warning("Nenhum frame extraído do vídeo")
-                return analysis_results
+            # Frames são decodificados sob demanda; com prefetch, a decodificação
+            # do próximo lote acontece em paralelo com a análise do lote atual
+            if self.config['video'].get('prefetch_frames', True):
+                frame_iter = self.video_processor.prefetch_frames(
+                    video_path, 2 * batch_size, with_index=True
+                )
+            else:
+                frame_iter = self.video_processor.iter_frames(video_path, with_index=True)
+            expected_frames = self.video_processor.estimate_frame_count(video_path)
             
-            # Análises frame por frame
-            print("🔍 Executando análises frame por frame...")
+            # Listas de resultados por categoria criadas uma única vez, antes do laço
+            for category in self.enabled_categories:
+                analysis_results.setdefault(category, [])
             
-            for i, frame in enumerate(tqdm(frames, desc="Analisando frames", unit="frame")):
-                try:
-                    frame_results = {}
-                    
-                    # Análise humana
-                    if self.config['analysis']['human_detection']:
-                        frame_results['human'] = self.human_analyzer.analyze_frame(frame)
-                    
-                    # Detecção de objetos
-                    if self.config['analysis']['object_detection']:
-                        frame_results['objects'] = self.object_detector.detect_objects(frame)
-                    
-                    # Detecção de animais
-                    if self.config['analysis']['animal_detection']:
-                        frame_results['animals'] = self.animal_detector.detect_animals(frame)
+            # Reaproveitar resultados em cenas estáveis (se configurado)
+            scene_detector = None
+            if analysis_config.get('reuse_stable_frames', False):
+                scene_detector = SceneChangeDetector(
+                    threshold=analysis_config.get('scene_change_threshold', 0.02),
+                    max_reuse=analysis_config.get('max_reused_frames', 30)
+                )
+            
+            with tqdm(total=expected_frames, desc="Analisando frames", unit="frame") as progress:
+                while True:
+                    batch = list(islice(frame_iter, batch_size))
+                    if not batch:
+                        break
                     
-                    # Análise de ambiente
-                    if self.config['analysis']['environment_analysis']:
-                        frame_results['environment'] = self.environment_analyzer.analyze_environment(frame)
+                    # Índices reais no vídeo (diferem da posição com frame_skip/adaptive_skip)
+                    frame_numbers = [frame_number for frame_number, _ in batch]
+                    batch_frames = [frame for _, frame in batch]
+                    del batch
                     
-                    # Análise médica (se disponível e habilitada)
-                    if (self.config['analysis'].get('medical_analysis', False) and 
-                        self.medical_analyzer is not None):
-                        frame_results['medical'] = self.medical_analyzer.analyze_anatomical_region(frame)
+                    start = total_frames
+                    total_frames += len(batch_frames)
                     
-                    # Salvar frame anotado se configurado
-                    if self.config['output']['save_frames']:
-                        self.video_processor.save_annotated_frame(
-                            frame, frame_results, i, video_path.stem
+                    try:
+                        batch_results, used_batch_size = self.analyze_frame_batch_with_backoff(
+                            batch_frames, start, scene_detector
                         )
+                        # Lotes seguintes (e próximos vídeos) usam o maior tamanho que coube na memória
+                        batch_size = self.batch_size = min(batch_size, used_batch_size)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Erro ao analisar frames {frame_numbers[0]}-{frame_numbers[-1]}: {str(e)}"
+                        )
+                        progress.update(len(batch_frames))
+                        continue
                     
-                    # Acumular resultados
-                    self.accumulate_results(analysis_results, frame_results, i)
+                    # Timestamps do lote inteiro em uma única operação vetorizada
+                    timestamps = (np.asarray(frame_numbers, dtype=np.float64) / fps).tolist()
                     
-                except Exception as e:
-                    self.logger.error(f"Erro ao analisar frame {i}: {str(e)}")
-                    continue
+                    for offset, (frame, frame_results) in enumerate(zip(batch_frames, batch_results)):
+                        i = frame_numbers[offset]
+                        try:
+                            # Salvar frame anotado se configurado
+                            if self._save_queue is not None:
+                                self._save_queue.put((frame, frame_results, i, video_path.stem, fps))
+                            
+                            # Acumular resultados
+                            self.accumulate_results(analysis_results, frame_results, i, timestamps[offset])
+                            
+                        except Exception as e:
+                            self.logger.error(f"Erro ao analisar frame {i}: {str(e)}")
+                            continue
+                    
+                    progress.update(len(batch_frames))
             
-            # Análise comportamental global
-            if self.config['analysis']['behavior_analysis']:
+            print(f"✓ Extraídos {total_frames} frames para análise")
+            self.logger.info(f"Extraídos {total_frames} frames de {video_path.name}")
+            
+            if total_frames == 0:
+                self.logger.warning("Nenhum frame extraído do vídeo")
+                return analysis_results
+            
+            # Análise comportamental global (a partir dos resultados acumulados)
+            if self.behavior_analyzer is not None:
                 print("🧠 Executando análise comportamental...")
                 try:
                     analysis_results['behavior_analysis'] = self.behavior_analyzer.analyze_behavior(
-                        frames, analysis_results
+                        analysis_results
                     )
                 except Exception as e:
                     self.logger.error(f"Erro na análise comportamental: {str(e)}")
@@ -276,6 +399,8 @@ class VideoAnalysisSystem:
             # Adicionar metadados finais
             analysis_results['metadata']['analysis_end_time'] = self.get_current_timestamp()
             analysis_results['metadata']['total_frames_processed'] = total_frames
+            if scene_detector is not None:
+                analysis_results['metadata']['frames_reused'] = scene_detector.frames_reused
             analysis_results['metadata']['analysis_success'] = True
             
             print(f"✅ Análise do vídeo {video_path.name} concluída com sucesso!")
@@ -294,51 +419,223 @@ class VideoAnalysisSystem:
                     'error_message': str(e)
                 }
             }
+        
+        finally:
+            # Aguardar a gravação de todos os frames deste vídeo
+            if self._save_queue is not None:
+                self._save_queue.join()
+            self.video_processor.close_annotated_video(video_path.stem)
+    
+    def get_enabled_categories(self):
+        """Retorna as categorias de análise em lote habilitadas na configuração"""
+        analysis_config = self.config['analysis']
+        flags = [
+            ('human', analysis_config['human_detection']),
+            ('objects', analysis_config['object_detection']),
+            ('animals', analysis_config['animal_detection']),
+            ('environment', analysis_config['environment_analysis']),
+            ('medical', MEDICAL_ANALYZER_AVAILABLE and analysis_config.get('medical_analysis', False)),
+        ]
+        
+        return [category for category, enabled in flags if enabled]
+    
+    def load_batch_analyzers(self):
+        """Carrega no processo principal os analisadores das categorias habilitadas"""
+        # Importados apenas quando habilitados (evita importar frameworks pesados)
+        categories = set(self.enabled_categories)
+        
+        if 'human' in categories:
+            from models.human_analyzer import HumanAnalyzer
+            self.human_analyzer = HumanAnalyzer(self.config)
+        
+        if 'objects' in categories:
+            from models.object_detector import ObjectDetector
+            self.object_detector = ObjectDetector(self.config)
+        
+        if 'animals' in categories:
+            from models.animal_detector import AnimalDetector
+            self.animal_detector = AnimalDetector(self.config)
+        
+        if 'environment' in categories:
+            from models.environment_analyzer import EnvironmentAnalyzer
+            self.environment_analyzer = EnvironmentAnalyzer(self.config)
+        
+        if 'medical' in categories:
+            self.medical_analyzer = MedicalAnalyzer(self.config)
+        
+        # Resolvidos uma única vez; consultados a cada lote de frames
+        self.enabled_analyzers = self.get_enabled_analyzers()
+    
+    def get_enabled_analyzers(self):
+        """Retorna (categoria, método de lote) dos analisadores habilitados"""
+        analyzers = [
+            ('human', self.human_analyzer, 'analyze_batch'),
+            ('objects', self.object_detector, 'detect_batch'),
+            ('animals', self.animal_detector, 'detect_batch'),
+            ('environment', self.environment_analyzer, 'analyze_batch'),
+            ('medical', self.medical_analyzer, 'analyze_batch'),
+        ]
+        
+        return [
+            (category, getattr(analyzer, method_name))
+            for category, analyzer, method_name in analyzers if analyzer is not None
+        ]
+    
+    def analyze_batch(self, batch):
+        """Executa os analisadores habilitados sobre um lote de frames (N, H, W, 3)"""
+        if self.analyzer_pool is not None:
+            try:
+                return self.analyzer_pool.analyze_batch(batch)
+            except AnalyzerPoolError as e:
+                # Pool inutilizável: seguir com os analisadores no processo principal.
+                # Falhas de um lote (inclusive falta de memória) seguem para quem chamou
+                self.logger.error(f"Falha no pool de análise, executando no processo principal: {e}")
+                self.analyzer_pool.close()
+                self.analyzer_pool = None
+                self.load_batch_analyzers()
+        
+        batch_results = [{} for _ in range(len(batch))]
+        
+        for category, analyze in self.enabled_analyzers:
+            for frame_results, result in zip(batch_results, analyze(batch)):
+                frame_results[category] = result
+        
+        return batch_results
+    
+    def analyze_frame_batch(self, batch_frames, start, scene_detector=None):
+        """
+        Analisa um lote de frames consecutivos
+        
+        Com scene_detector, apenas frames com mudança de cena são analisados;
+        os demais recebem uma cópia dos resultados do último frame analisado.
+        """
+        if scene_detector is None:
+            return self.analyze_batch(np.stack(batch_frames))
+        
+        selected = [
+            offset for offset, frame in enumerate(batch_frames)
+            if scene_detector.needs_analysis(frame, start + offset)
+        ]
+        
+        try:
+            analyzed = {}
+            if selected:
+                selected_results = self.analyze_batch(np.stack([batch_frames[k] for k in selected]))
+                analyzed = dict(zip(selected, selected_results))
+        except Exception:
+            # Sem resultados válidos como referência: reanalisar o próximo frame
+            scene_detector.reset()
+            raise
+        
+        batch_results = []
+        for offset in range(len(batch_frames)):
+            if offset in analyzed:
+                scene_detector.last_results = analyzed[offset]
+                batch_results.append(analyzed[offset])
+            else:
+                batch_results.append(copy.copy(scene_detector.last_results))
+        
+        return batch_results
+    
+    def analyze_frame_batch_with_backoff(self, batch_frames, start, scene_detector=None):
+        """
+        Analisa um lote, reduzindo-o pela metade a cada falta de memória
+        
+        Returns:
+            Tupla (resultados por frame, tamanho de lote que coube na memória)
+        """
+        chunk_size = len(batch_frames)
+        # Uma nova tentativa deve partir do mesmo estado de reaproveitamento
+        scene_state = scene_detector.snapshot() if scene_detector is not None else None
+        
+        while True:
+            try:
+                batch_results = []
+                for offset in range(0, len(batch_frames), chunk_size):
+                    batch_results.extend(self.analyze_frame_batch(
+                        batch_frames[offset:offset + chunk_size], start + offset, scene_detector
+                    ))
+                return batch_results, chunk_size
+            except Exception as e:
+                if chunk_size == 1 or not self._is_out_of_memory(e):
+                    raise
+                if scene_detector is not None:
+                    scene_detector.restore(scene_state)
+                chunk_size //= 2
+                self.logger.warning(f"Memória insuficiente, reduzindo o lote para {chunk_size} frames")
+    
+    @staticmethod
+    def _is_out_of_memory(error):
+        """Identifica falta de memória (RAM, GPU ou relatada por um processo de análise)"""
+        return isinstance(error, MemoryError) or (
+            isinstance(error, RuntimeError) and 'out of memory' in str(error).lower()
+        )
+    
+    def _save_worker(self):
+        """Consome a fila de frames anotados e os grava em disco"""
+        while True:
+            item = self._save_queue.get()
+            try:
+                if item is None:
+                    break
+                frame, frame_results, frame_index, video_name, fps = item
+                self.video_processor.save_annotated_frame(
+                    frame, frame_results, frame_index, video_name, fps
+                )
+            except Exception as e:
+                self.logger.error(f"Erro ao salvar frame {item[2]}: {str(e)}")
+            finally:
+                self._save_queue.task_done()
+    
+    def shutdown(self):
+        """Libera recursos persistentes (processos de análise e threads de gravação)"""
+        if self.analyzer_pool is not None:
+            self.analyzer_pool.close()
+            self.analyzer_pool = None
+        
+        if self.visualization_manager is not None:
+            self.visualization_manager.close()
+        
+        if self._save_queue is not None:
+            for _ in self._save_threads:
+                self._save_queue.put(None)
+            for thread in self._save_threads:
+                thread.join()
+            self._save_queue = None
+            self._save_threads = []
     
     def create_visualizations(self, analysis_results, video_name):
         """Cria visualizações da análise"""
         try:
-            # Dashboard principal
-            dashboard_path = self.visualization_manager.create_analysis_dashboard(
-                analysis_results, video_name
+            # Dashboard, heatmap, infográfico e análise médica específica (se disponível),
+            # gerados em paralelo quando configurado
+            include_medical = bool(analysis_results.get('medical_analysis'))
+            chart_paths = self.visualization_manager.create_all(
+                analysis_results, video_name, include_medical
             )
-            if dashboard_path:
-                self.logger.info(f"Dashboard criado: {dashboard_path}")
             
-            # Heatmap de detecções
-            heatmap_path = self.visualization_manager.create_detection_heatmap(
-                analysis_results, video_name
-            )
-            if heatmap_path:
-                self.logger.info(f"Heatmap criado: {heatmap_path}")
-            
-            # Infográfico resumo
-            infographic_path = self.visualization_manager.create_summary_infographic(
-                analysis_results, video_name
-            )
-            if infographic_path:
-                self.logger.info(f"Infográfico criado: {infographic_path}")
-            
-            # Análise médica específica (se disponível)
-            if 'medical_analysis' in analysis_results and analysis_results['medical_analysis']:
-                medical_chart_path = self.visualization_manager.create_medical_analysis_chart(
-                    analysis_results, video_name
-                )
-                if medical_chart_path:
-                    self.logger.info(f"Gráfico médico criado: {medical_chart_path}")
+            chart_labels = {
+                'create_analysis_dashboard': 'Dashboard',
+                'create_detection_heatmap': 'Heatmap',
+                'create_summary_infographic': 'Infográfico',
+                'create_medical_analysis_chart': 'Gráfico médico'
+            }
+            for builder, chart_path in chart_paths.items():
+                if chart_path:
+                    self.logger.info(f"{chart_labels[builder]} criado: {chart_path}")
             
         except Exception as e:
             self.logger.error(f"Erro ao criar visualizações para {video_name}: {str(e)}")
     
-    def accumulate_results(self, analysis_results, frame_results, frame_number):
+    def accumulate_results(self, analysis_results, frame_results, frame_number, timestamp=None):
         """Acumula resultados de cada frame na análise global"""
+        if timestamp is None:
+            timestamp = frame_number / 30.0  # Assumindo 30 FPS
+        
         for category, data in frame_results.items():
-            if category not in analysis_results:
-                analysis_results[category] = []
-            
             analysis_results[category].append({
                 'frame': frame_number,
-                'timestamp': frame_number / 30.0,  # Assumindo 30 FPS
+                'timestamp': timestamp,
                 'data': data
             })
     
@@ -372,45 +669,40 @@ class VideoAnalysisSystem:
         all_results = {}
         successful_analyses = 0
         failed_analyses = 0
+        parallel_videos = int(self.config['video'].get('parallel_videos', 1))
         
-        for video_index, video_path in enumerate(video_files, 1):
-            try:
-                print(f"\n📹 PROCESSANDO VÍDEO {video_index}/{len(video_files)}")
-                print(f"   Arquivo: {video_path.name}")
-                
-                # Executar análise
-                video_results = self.analyze_video(video_path)
-                
-                # Verificar se a análise foi bem-sucedida
-                if video_results.get('metadata', {}).get('analysis_success', False):
-                    all_results[video_path.stem] = video_results
-                    successful_analyses += 1
+        if parallel_videos > 1 and len(video_files) > 1:
+            successful_analyses, failed_analyses = self.analyze_videos_parallel(
+                video_files, all_results, parallel_videos
+            )
+        else:
+            # Modo paralelo configurado, mas com um único vídeo: analisar neste processo
+            if not self.analyzers_initialized:
+                self.initialize_analyzers()
+            
+            for video_index, video_path in enumerate(video_files, 1):
+                try:
+                    print(f"\n📹 PROCESSANDO VÍDEO {video_index}/{len(video_files)}")
+                    print(f"   Arquivo: {video_path.name}")
                     
-                    # Gerar relatório individual
-                    if self.config['output']['generate_report']:
-                        try:
-                            report_path = self.report_generator.generate_report(
-                                video_results, video_path.stem
-                            )
-                            if report_path:
-                                print(f"📄 Relatório salvo: {Path(report_path).name}")
-                        except Exception as e:
-                            self.logger.error(f"Erro ao gerar relatório para {video_path.stem}: {str(e)}")
+                    # Executar análise
+                    video_results = self.analyze_video(video_path)
                     
-                    print(f"✅ Análise concluída para: {video_path.name}")
+                    if self.handle_video_results(video_path, video_results, all_results):
+                        successful_analyses += 1
+                    else:
+                        failed_analyses += 1
                     
-                else:
+                except KeyboardInterrupt:
+                    print("\n⏹️  Análise interrompida pelo usuário")
+                    break
+                except Exception as e:
                     failed_analyses += 1
-                    print(f"❌ Falha na análise de: {video_path.name}")
-                
-            except KeyboardInterrupt:
-                print("\n⏹️  Análise interrompida pelo usuário")
-                break
-            except Exception as e:
-                failed_analyses += 1
-                print(f"❌ Erro ao analisar {video_path.name}: {str(e)}")
-                self.logger.error(f"Erro ao analisar {video_path}: {str(e)}")
-                continue
+                    print(f"❌ Erro ao analisar {video_path.name}: {str(e)}")
+                    self.logger.error(f"Erro ao analisar {video_path}: {str(e)}")
+                    continue
+        
+        self.shutdown()
         
         # Gerar relatório consolidado
         if len(all_results) > 1:
@@ -441,11 +733,112 @@ class VideoAnalysisSystem:
         
         return all_results
     
+    def handle_video_results(self, video_path, video_results, all_results):
+        """Registra o resultado de um vídeo e gera seu relatório; retorna True se bem-sucedido"""
+        # Verificar se a análise foi bem-sucedida
+        if not video_results.get('metadata', {}).get('analysis_success', False):
+            print(f"❌ Falha na análise de: {video_path.name}")
+            return False
+        
+        all_results[video_path.stem] = video_results
+        
+        # Gerar relatório individual
+        if self.config['output']['generate_report']:
+            try:
+                report_path = self.report_generator.generate_report(
+                    video_results, video_path.stem
+                )
+                if report_path:
+                    print(f"📄 Relatório salvo: {Path(report_path).name}")
+            except Exception as e:
+                self.logger.error(f"Erro ao gerar relatório para {video_path.stem}: {str(e)}")
+        
+        print(f"✅ Análise concluída para: {video_path.name}")
+        return True
+    
+    def analyze_videos_parallel(self, video_files, all_results, max_workers):
+        """Analisa vários vídeos simultaneamente em processos separados"""
+        gpu_ids = self.config['video'].get('parallel_gpu_ids') or []
+        max_workers = min(max_workers, len(video_files))
+        print(f"\n⚡ Analisando {len(video_files)} vídeos em {max_workers} processos")
+        
+        context = mp.get_context('spawn')
+        gpu_queue = None
+        if gpu_ids:
+            # Um dispositivo por processo, distribuídos em rodízio
+            gpu_queue = context.Queue()
+            for worker_index in range(max_workers):
+                gpu_queue.put(gpu_ids[worker_index % len(gpu_ids)])
+        
+        successful_analyses = 0
+        failed_analyses = 0
+        completed_results = {}
+        
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                 initializer=_init_video_worker,
+                                 initargs=(self.config, gpu_queue)) as executor:
+            futures = {
+                executor.submit(_analyze_video_in_worker, video_path): video_path
+                for video_path in video_files
+            }
+            
+            try:
+                for future in as_completed(futures):
+                    video_path = futures[future]
+                    try:
+                        video_results = future.result()
+                    except Exception as e:
+                        failed_analyses += 1
+                        print(f"❌ Erro ao analisar {video_path.name}: {str(e)}")
+                        self.logger.error(f"Erro ao analisar {video_path}: {str(e)}")
+                        continue
+                    
+                    if self.handle_video_results(video_path, video_results, completed_results):
+                        successful_analyses += 1
+                    else:
+                        failed_analyses += 1
+                        
+            except KeyboardInterrupt:
+                print("\n⏹️  Análise interrompida pelo usuário")
+                for future in futures:
+                    future.cancel()
+        
+        # Manter a ordem original dos vídeos no relatório consolidado
+        for video_path in video_files:
+            if video_path.stem in completed_results:
+                all_results[video_path.stem] = completed_results[video_path.stem]
+        
+        return successful_analyses, failed_analyses
+    
     def get_current_timestamp(self):
         """Retorna timestamp atual"""
         from datetime import datetime
         return datetime.now().isoformat()
 
+# Sistema de análise do processo trabalhador (análise paralela de vídeos)
+_worker_system = None
+
+def _init_video_worker(config, gpu_queue=None):
+    """Inicializa um processo trabalhador com seu próprio sistema de análise"""
+    global _worker_system
+    
+    # Precisa ser definido antes de qualquer framework de GPU ser carregado
+    if gpu_queue is not None:
+        os.environ['CUDA_VISIBLE_DEVICES'] = str(gpu_queue.get())
+    
+    worker_config = copy.deepcopy(config)
+    # Processos trabalhadores não podem criar o próprio pool de analisadores
+    worker_config['analysis']['worker_processes'] = False
+    # Cada trabalhador analisa um vídeo por vez, com seus próprios analisadores
+    worker_config['video']['parallel_videos'] = 1
+    # Os vídeos já ocupam um processo cada; gráficos são gerados no próprio trabalhador
+    worker_config['output']['visualization_workers'] = 1
+    _worker_system = VideoAnalysisSystem(config=worker_config)
+
+def _analyze_video_in_worker(video_path):
+    """Analisa um vídeo no processo trabalhador"""
+    return _worker_system.analyze_video(video_path)
+
 def display_system_info():
     """Exibe informações do sistema"""
     print("💻 INFORMAÇÕES DO SISTEMA")
@@ -19,3 +19,7 @@ class AnimalDetector:
             'environment_interaction': {},
             'group_dynamics': {}
         }
+    
+    def detect_batch(self, frames):
+        """Placeholder para detecção em um lote de frames (N, H, W, 3)"""
+        return [self.detect_animals(frame) for frame in frames]
@@ -8,8 +8,8 @@ class BehaviorAnalyzer:
         self.config = config
         print("✓ BehaviorAnalyzer inicializado (modo placeholder)")
     
-    def analyze_behavior(self, frames, analysis_results):
-        """Placeholder para análise comportamental"""
+    def analyze_behavior(self, analysis_results):
+        """Placeholder para análise comportamental a partir dos resultados acumulados"""
         return {
             'temporal_analysis': {
                 'behavior_timeline': [
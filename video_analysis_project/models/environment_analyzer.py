@@ -35,3 +35,7 @@ class EnvironmentAnalyzer:
             'resource_availability': {'basic_amenities': {}},
             'environmental_hazards': {'physical_hazards': []}
         }
+    
+    def analyze_batch(self, frames):
+        """Placeholder para análise de um lote de frames (N, H, W, 3)"""
+        return [self.analyze_environment(frame) for frame in frames]
@@ -18,3 +18,7 @@ class HumanAnalyzer:
             'body_analysis': [{'condition': 'normal', 'activity': 'stationary'}],
             'behavioral_indicators': ['calm', 'attentive']
         }
+    
+    def analyze_batch(self, frames):
+        """Placeholder para análise de um lote de frames (N, H, W, 3)"""
+        return [self.analyze_frame(frame) for frame in frames]
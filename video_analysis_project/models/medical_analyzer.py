@@ -7,23 +7,361 @@ Análise anatômica especializada sem dependências externas
 import numpy as np
 from typing import Dict, List, Tuple, Any
 import logging
+import pickle
 from collections import defaultdict
+from datetime import datetime
+
+# Modelos dos resultados simulados: construídos uma única vez no carregamento do
+# módulo; cada chamada devolve uma cópia independente (ver _FROZEN_TEMPLATES)
+_SIMULATED_ANATOMICAL_ANALYSIS = {
+    'breast_analysis': {
+        'shape_analysis': {
+            'shape_type': 'normal_teardrop',
+            'symmetry_score': 0.92,
+            'proportion_score': 0.88,
+            'contour_regularity': 0.91
+        },
+        'size_estimation': {
+            'size_category': 'medium',
+            'volume_estimate_ml': 350,
+            'cup_size_estimate': 'B-C',
+            'proportionality': 'proportionate'
+        },
+        'surface_analysis': {
+            'skin_texture': 'smooth',
+            'skin_elasticity': 'normal',
+            'surface_uniformity': 0.89,
+            'visible_veins': 'minimal'
+        },
+        'structural_integrity': {
+            'integrity_score': 0.94,
+            'structural_anomalies': [],
+            'support_assessment': 'adequate'
+        }
+    },
+    'nipple_analysis': {
+        'detection_result': {
+            'detected': True,
+            'location': {'x': 320, 'y': 280},
+            'detection_confidence': 0.91
+        },
+        'size_measurements': {
+            'diameter_mm': 12.3,
+            'height_mm': 3.1,
+            'area_mm2': 118.7,
+            'size_category': 'normal'
+        },
+        'color_analysis': {
+            'dominant_color': 'pink_brown',
+            'color_uniformity': 0.84,
+            'pigmentation_level': 'normal',
+            'color_changes': []
+        },
+        'shape_characteristics': {
+            'shape_type': 'cylindrical_protruding',
+            'symmetry_score': 0.89,
+            'regularity_score': 0.87,
+            'anatomical_variants': []
+        },
+        'surface_condition': {
+            'texture': 'normal_textured',
+            'smoothness_score': 0.81,
+            'surface_irregularities': [],
+            'dryness_level': 'normal'
+        },
+        'discharge_analysis': {
+            'discharge_detected': False,
+            'discharge_type': None,
+            'discharge_color': None,
+            'discharge_consistency': None,
+            'discharge_amount': None
+        },
+        'sensitivity_indicators': {
+            'visual_sensitivity_signs': [],
+            'swelling_detected': False,
+            'tenderness_indicators': [],
+            'temperature_variation': 'normal'
+        }
+    },
+    'areola_analysis': {
+        'detection_result': {
+            'detected': True,
+            'location': {'center_x': 320, 'center_y': 280},
+            'detection_confidence': 0.88
+        },
+        'size_measurements': {
+            'diameter_mm': 34.7,
+            'area_mm2': 945.8,
+            'circumference_mm': 109.0,
+            'size_category': 'normal'
+        },
+        'color_characteristics': {
+            'dominant_color': 'light_brown',
+            'pigmentation_level': 'normal',
+            'color_gradient': True,
+            'color_uniformity': 0.82
+        },
+        'texture_analysis': {
+            'texture_type': 'slightly_bumpy',
+            'texture_uniformity': 0.79,
+            'surface_quality': 'normal',
+            'texture_variations': []
+        },
+        'montgomery_glands': {
+            'glands_detected': True,
+            'gland_count': 9,
+            'gland_prominence': 'normal',
+            'gland_distribution': 'uniform',
+            'gland_condition': 'healthy'
+        },
+        'skin_condition': {
+            'skin_health': 'normal',
+            'dryness_level': 'normal',
+            'irritation_signs': [],
+            'scaling_detected': False
+        }
+    },
+    'skin_analysis': {
+        'overall_condition': {
+            'condition_score': 0.91,
+            'condition_category': 'healthy',
+            'age_indicators': 'age_appropriate'
+        },
+        'color_analysis': {
+            'skin_tone': 'natural',
+            'color_uniformity': 0.88,
+            'pigmentation_variations': [],
+            'sun_damage_signs': []
+        },
+        'texture_assessment': {
+            'texture_quality': 'smooth',
+            'texture_score': 0.89,
+            'roughness_level': 'minimal',
+            'texture_variations': []
+        },
+        'visible_marks': {
+            'moles_detected': 2,
+            'mole_details': [
+                {'size_mm': 3.2, 'color': 'brown', 'shape': 'round', 'location': 'lower_quadrant'},
+                {'size_mm': 2.1, 'color': 'light_brown', 'shape': 'oval', 'location': 'upper_quadrant'}
+            ],
+            'freckles_detected': 0,
+            'birthmarks_detected': 0
+        },
+        'discoloration_areas': [],
+        'surface_irregularities': [],
+        'redness_detection': {
+            'redness_detected': False,
+            'redness_areas': [],
+            'redness_intensity': None
+        },
+        'lesion_detection': {
+            'lesions_detected': False,
+            'lesion_count': 0,
+            'lesion_types': []
+        },
+        'stretch_marks': {
+            'stretch_marks_detected': False,
+            'stretch_mark_count': 0,
+            'stretch_mark_severity': None
+        },
+        'injury_signs': {
+            'injuries_detected': False,
+            'injury_types': [],
+            'healing_signs': []
+        }
+    },
+    'symmetry_analysis': {
+        'bilateral_symmetry': 0.91,
+        'size_symmetry': 0.89,
+        'shape_symmetry': 0.93,
+        'position_symmetry': 0.87,
+        'overall_symmetry_score': 0.90
+    }
+}
+
+_SIMULATED_HEALTH_ASSESSMENT = {
+    'overall_health_score': 0.92,
+    'health_category': 'normal_healthy',
+    'normal_indicators': [
+        'symmetric_breast_shape',
+        'normal_skin_color_and_texture',
+        'appropriate_nipple_areola_complex',
+        'no_visible_abnormalities',
+        'healthy_skin_condition',
+        'normal_proportions',
+        'no_discharge_detected',
+        'no_discoloration',
+        'no_lesions_detected'
+    ],
+    'attention_indicators': [
+        'routine_monitoring_recommended'
+    ],
+    'concern_indicators': [],
+    'health_categories': {
+        'anatomical_health': 'normal',
+        'skin_health': 'excellent',
+        'functional_health': 'normal',
+        'aesthetic_health': 'normal'
+    },
+    'risk_assessment': {
+        'risk_level': 'low',
+        'risk_factors': [],
+        'protective_factors': [
+            'normal_anatomical_structure',
+            'healthy_skin_condition',
+            'no_concerning_findings'
+        ]
+    },
+    'follow_up_recommendations': [
+        'continue_monthly_self_examinations',
+        'maintain_regular_medical_checkups',
+        'follow_healthy_lifestyle_practices'
+    ],
+    'screening_recommendations': {
+        'next_clinical_exam': 'annual_routine',
+        'imaging_recommendations': 'age_appropriate_guidelines',
+        'self_examination_frequency': 'monthly'
+    }
+}
+
+_SIMULATED_OBSERVATIONS = {
+    'anatomical_observations': [
+        'Bilateral breast anatomy within normal limits',
+        'Nipple-areola complex demonstrates normal characteristics',
+        'Skin texture and color appear healthy',
+        'Structural integrity maintained',
+        'Proportionate anatomical features observed'
+    ],
+    'physiological_notes': [
+        'No signs of physiological abnormalities detected',
+        'Normal developmental characteristics present',
+        'Healthy tissue appearance throughout examination area'
+    ],
+    'morphological_characteristics': [
+        'Standard morphological presentation',
+        'Age-appropriate anatomical development',
+        'Symmetrical bilateral features',
+        'Normal contour and shape characteristics'
+    ],
+    'comparative_analysis': {
+        'comparison_baseline': 'within_normal_anatomical_limits',
+        'population_percentile': '75th_percentile_normal',
+        'age_group_comparison': 'appropriate_for_demographic'
+    },
+    'developmental_indicators': [
+        'mature_anatomical_development',
+        'appropriate_developmental_stage',
+        'normal_structural_maturation'
+    ],
+    'functional_assessments': [
+        'normal_functionality_indicators',
+        'appropriate_anatomical_function',
+        'healthy_physiological_presentation'
+    ]
+}
+
+_SIMULATED_MEDICAL_INDICATORS = {
+    'diagnostic_markers': [
+        'normal_anatomical_presentation',
+        'healthy_tissue_characteristics',
+        'appropriate_morphological_features'
+    ],
+    'screening_results': {
+        'screening_status': 'normal_findings',
+        'screening_category': 'routine_low_risk',
+        'screening_confidence': 0.91
+    },
+    'clinical_significance': {
+        'significance_level': 'routine_normal',
+        'clinical_relevance': 'baseline_documentation',
+        'medical_importance': 'routine_health_assessment'
+    },
+    'medical_terminology': {
+        'primary_findings': [
+            'bilateral_mammary_glands_wnl',
+            'nipple_areola_complex_intact',
+            'overlying_skin_unremarkable'
+        ],
+        'clinical_descriptors': [
+            'symmetrical_breast_contour',
+            'normal_skin_pigmentation',
+            'appropriate_anatomical_positioning'
+        ]
+    },
+    'quantitative_measurements': {
+        'anatomical_dimensions': {
+            'nipple_diameter': 12.3,
+            'areola_diameter': 34.7,
+            'symmetry_index': 0.91
+        },
+        'health_scores': {
+            'overall_health_score': 0.92,
+            'anatomical_score': 0.91,
+            'skin_health_score': 0.94
+        }
+    },
+    'qualitative_assessments': {
+        'aesthetic_evaluation': 'normal_appearance',
+        'functional_assessment': 'appropriate_function',
+        'health_classification': 'healthy_normal'
+    }
+}
+
+_SIMULATED_RECOMMENDATIONS = [
+    '✓ Continue with monthly breast self-examinations',
+    '✓ Maintain regular annual medical check-ups',
+    '✓ Follow age-appropriate screening guidelines',
+    '✓ Maintain healthy lifestyle practices',
+    '✓ Monitor for any changes and report to healthcare provider',
+    '✓ Keep documentation of examination findings',
+    '✓ Stay informed about breast health recommendations',
+    '✓ Consider genetic counseling if family history warrants',
+    '✓ Maintain proper skin care routine',
+    '✓ Report any new symptoms or concerns promptly'
+]
+
+_ANALYSIS_METADATA = {
+    'analysis_version': '1.0.0',
+    'analysis_type': 'comprehensive_anatomical',
+    'confidence_threshold': 0.8,
+    'processing_mode': 'detailed_medical',
+    'quality_assurance': 'multi_parameter_validation',
+    'medical_standards': 'clinical_assessment_protocol'
+}
+
+# Modelos serializados uma vez: pickle.loads reconstrói uma cópia profunda bem mais
+# rápido que copy.deepcopy, e quem alterar um resultado não afeta os demais frames
+_FROZEN_TEMPLATES = {
+    name: pickle.dumps(template, pickle.HIGHEST_PROTOCOL)
+    for name, template in (
+        ('anatomical_analysis', _SIMULATED_ANATOMICAL_ANALYSIS),
+        ('health_assessment', _SIMULATED_HEALTH_ASSESSMENT),
+        ('observations', _SIMULATED_OBSERVATIONS),
+        ('medical_indicators', _SIMULATED_MEDICAL_INDICATORS),
+        ('recommendations', _SIMULATED_RECOMMENDATIONS),
+        ('analysis_metadata', _ANALYSIS_METADATA)
+    )
+}
 
 class MedicalAnalyzer:
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger('MedicalAnalyzer')
+        # Consultado uma vez: evita montar registros de log por frame quando desabilitados
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        self.logger.info("Análise anatômica médica em modo simulação")
         self.setup_medical_detectors()
         self.setup_anatomical_references()
         print("✓ MedicalAnalyzer inicializado (modo placeholder)")
-        
+    
     def setup_medical_detectors(self):
         """Inicializa detectores médicos especializados"""
         self.breast_analyzer = BreastAnalyzer()
         self.skin_analyzer = SkinAnalyzer()
         self.anatomical_detector = AnatomicalDetector()
         self.health_indicator_analyzer = HealthIndicatorAnalyzer()
-        
+    
     def setup_anatomical_references(self):
         """Carrega referências anatômicas"""
         self.anatomical_references = {
@@ -46,11 +384,12 @@ class MedicalAnalyzer:
         
         Args:
             frame: Frame contendo região anatômica
-            
+        
         Returns:
             Análise detalhada da região
         """
-        self.logger.info("Executando análise anatômica médica (modo simulação)")
+        if self._debug_enabled:
+            self.logger.debug("Executando análise anatômica médica (modo simulação)")
         
         # Simular análise detalhada
         analysis_results = {
@@ -67,339 +406,45 @@ class MedicalAnalyzer:
         
         return analysis_results
     
+    def analyze_batch(self, frames: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Análise anatômica de um lote de frames
+        
+        Args:
+            frames: Lote de frames empilhados (N, H, W, 3)
+        
+        Returns:
+            Lista com a análise de cada frame do lote
+        """
+        return [self.analyze_anatomical_region(frame) for frame in frames]
+    
     def perform_simulated_anatomical_analysis(self) -> Dict[str, Any]:
         """Simula análise anatômica detalhada"""
-        return {
-            'breast_analysis': {
-                'shape_analysis': {
-                    'shape_type': 'normal_teardrop',
-                    'symmetry_score': 0.92,
-                    'proportion_score': 0.88,
-                    'contour_regularity': 0.91
-                },
-                'size_estimation': {
-                    'size_category': 'medium',
-                    'volume_estimate_ml': 350,
-                    'cup_size_estimate': 'B-C',
-                    'proportionality': 'proportionate'
-                },
-                'surface_analysis': {
-                    'skin_texture': 'smooth',
-                    'skin_elasticity': 'normal',
-                    'surface_uniformity': 0.89,
-                    'visible_veins': 'minimal'
-                },
-                'structural_integrity': {
-                    'integrity_score': 0.94,
-                    'structural_anomalies': [],
-                    'support_assessment': 'adequate'
-                }
-            },
-            'nipple_analysis': {
-                'detection_result': {
-                    'detected': True,
-                    'location': {'x': 320, 'y': 280},
-                    'detection_confidence': 0.91
-                },
-                'size_measurements': {
-                    'diameter_mm': 12.3,
-                    'height_mm': 3.1,
-                    'area_mm2': 118.7,
-                    'size_category': 'normal'
-                },
-                'color_analysis': {
-                    'dominant_color': 'pink_brown',
-                    'color_uniformity': 0.84,
-                    'pigmentation_level': 'normal',
-                    'color_changes': []
-                },
-                'shape_characteristics': {
-                    'shape_type': 'cylindrical_protruding',
-                    'symmetry_score': 0.89,
-                    'regularity_score': 0.87,
-                    'anatomical_variants': []
-                },
-                'surface_condition': {
-                    'texture': 'normal_textured',
-                    'smoothness_score': 0.81,
-                    'surface_irregularities': [],
-                    'dryness_level': 'normal'
-                },
-                'discharge_analysis': {
-                    'discharge_detected': False,
-                    'discharge_type': None,
-                    'discharge_color': None,
-                    'discharge_consistency': None,
-                    'discharge_amount': None
-                },
-                'sensitivity_indicators': {
-                    'visual_sensitivity_signs': [],
-                    'swelling_detected': False,
-                    'tenderness_indicators': [],
-                    'temperature_variation': 'normal'
-                }
-            },
-            'areola_analysis': {
-                'detection_result': {
-                    'detected': True,
-                    'location': {'center_x': 320, 'center_y': 280},
-                    'detection_confidence': 0.88
-                },
-                'size_measurements': {
-                    'diameter_mm': 34.7,
-                    'area_mm2': 945.8,
-                    'circumference_mm': 109.0,
-                    'size_category': 'normal'
-                },
-                'color_characteristics': {
-                    'dominant_color': 'light_brown',
-                    'pigmentation_level': 'normal',
-                    'color_gradient': True,
-                    'color_uniformity': 0.82
-                },
-                'texture_analysis': {
-                    'texture_type': 'slightly_bumpy',
-                    'texture_uniformity': 0.79,
-                    'surface_quality': 'normal',
-                    'texture_variations': []
-                },
-                'montgomery_glands': {
-                    'glands_detected': True,
-                    'gland_count': 9,
-                    'gland_prominence': 'normal',
-                    'gland_distribution': 'uniform',
-                    'gland_condition': 'healthy'
-                },
-                'skin_condition': {
-                    'skin_health': 'normal',
-                    'dryness_level': 'normal',
-                    'irritation_signs': [],
-                    'scaling_detected': False
-                }
-            },
-            'skin_analysis': {
-                'overall_condition': {
-                    'condition_score': 0.91,
-                    'condition_category': 'healthy',
-                    'age_indicators': 'age_appropriate'
-                },
-                'color_analysis': {
-                    'skin_tone': 'natural',
-                    'color_uniformity': 0.88,
-                    'pigmentation_variations': [],
-                    'sun_damage_signs': []
-                },
-                'texture_assessment': {
-                    'texture_quality': 'smooth',
-                    'texture_score': 0.89,
-                    'roughness_level': 'minimal',
-                    'texture_variations': []
-                },
-                'visible_marks': {
-                    'moles_detected': 2,
-                    'mole_details': [
-                        {'size_mm': 3.2, 'color': 'brown', 'shape': 'round', 'location': 'lower_quadrant'},
-                        {'size_mm': 2.1, 'color': 'light_brown', 'shape': 'oval', 'location': 'upper_quadrant'}
-                    ],
-                    'freckles_detected': 0,
-                    'birthmarks_detected': 0
-                },
-                'discoloration_areas': [],
-                'surface_irregularities': [],
-                'redness_detection': {
-                    'redness_detected': False,
-                    'redness_areas': [],
-                    'redness_intensity': None
-                },
-                'lesion_detection': {
-                    'lesions_detected': False,
-                    'lesion_count': 0,
-                    'lesion_types': []
-                },
-                'stretch_marks': {
-                    'stretch_marks_detected': False,
-                    'stretch_mark_count': 0,
-                    'stretch_mark_severity': None
-                },
-                'injury_signs': {
-                    'injuries_detected': False,
-                    'injury_types': [],
-                    'healing_signs': []
-                }
-            },
-            'symmetry_analysis': {
-                'bilateral_symmetry': 0.91,
-                'size_symmetry': 0.89,
-                'shape_symmetry': 0.93,
-                'position_symmetry': 0.87,
-                'overall_symmetry_score': 0.90
-            }
-        }
+        return pickle.loads(_FROZEN_TEMPLATES['anatomical_analysis'])
     
     def perform_simulated_health_assessment(self) -> Dict[str, Any]:
         """Simula avaliação de saúde"""
-        return {
-            'overall_health_score': 0.92,
-            'health_category': 'normal_healthy',
-            'normal_indicators': [
-                'symmetric_breast_shape',
-                'normal_skin_color_and_texture',
-                'appropriate_nipple_areola_complex',
-                'no_visible_abnormalities',
-                'healthy_skin_condition',
-                'normal_proportions',
-                'no_discharge_detected',
-                'no_discoloration',
-                'no_lesions_detected'
-            ],
-            'attention_indicators': [
-                'routine_monitoring_recommended'
-            ],
-            'concern_indicators': [],
-            'health_categories': {
-                'anatomical_health': 'normal',
-                'skin_health': 'excellent',
-                'functional_health': 'normal',
-                'aesthetic_health': 'normal'
-            },
-            'risk_assessment': {
-                'risk_level': 'low',
-                'risk_factors': [],
-                'protective_factors': [
-                    'normal_anatomical_structure',
-                    'healthy_skin_condition',
-                    'no_concerning_findings'
-                ]
-            },
-            'follow_up_recommendations': [
-                'continue_monthly_self_examinations',
-                'maintain_regular_medical_checkups',
-                'follow_healthy_lifestyle_practices'
-            ],
-            'screening_recommendations': {
-                'next_clinical_exam': 'annual_routine',
-                'imaging_recommendations': 'age_appropriate_guidelines',
-                'self_examination_frequency': 'monthly'
-            }
-        }
+        return pickle.loads(_FROZEN_TEMPLATES['health_assessment'])
     
     def generate_simulated_observations(self) -> Dict[str, Any]:
         """Gera observações médicas simuladas"""
-        return {
-            'anatomical_observations': [
-                'Bilateral breast anatomy within normal limits',
-                'Nipple-areola complex demonstrates normal characteristics',
-                'Skin texture and color appear healthy',
-                'Structural integrity maintained',
-                'Proportionate anatomical features observed'
-            ],
-            'physiological_notes': [
-                'No signs of physiological abnormalities detected',
-                'Normal developmental characteristics present',
-                'Healthy tissue appearance throughout examination area'
-            ],
-            'morphological_characteristics': [
-                'Standard morphological presentation',
-                'Age-appropriate anatomical development',
-                'Symmetrical bilateral features',
-                'Normal contour and shape characteristics'
-            ],
-            'comparative_analysis': {
-                'comparison_baseline': 'within_normal_anatomical_limits',
-                'population_percentile': '75th_percentile_normal',
-                'age_group_comparison': 'appropriate_for_demographic'
-            },
-            'developmental_indicators': [
-                'mature_anatomical_development',
-                'appropriate_developmental_stage',
-                'normal_structural_maturation'
-            ],
-            'functional_assessments': [
-                'normal_functionality_indicators',
-                'appropriate_anatomical_function',
-                'healthy_physiological_presentation'
-            ]
-        }
+        return pickle.loads(_FROZEN_TEMPLATES['observations'])
     
     def extract_simulated_medical_indicators(self) -> Dict[str, Any]:
         """Extrai indicadores médicos simulados"""
-        return {
-            'diagnostic_markers': [
-                'normal_anatomical_presentation',
-                'healthy_tissue_characteristics',
-                'appropriate_morphological_features'
-            ],
-            'screening_results': {
-                'screening_status': 'normal_findings',
-                'screening_category': 'routine_low_risk',
-                'screening_confidence': 0.91
-            },
-            'clinical_significance': {
-                'significance_level': 'routine_normal',
-                'clinical_relevance': 'baseline_documentation',
-                'medical_importance': 'routine_health_assessment'
-            },
-            'medical_terminology': {
-                'primary_findings': [
-                    'bilateral_mammary_glands_wnl',
-                    'nipple_areola_complex_intact',
-                    'overlying_skin_unremarkable'
-                ],
-                'clinical_descriptors': [
-                    'symmetrical_breast_contour',
-                    'normal_skin_pigmentation',
-                    'appropriate_anatomical_positioning'
-                ]
-            },
-            'quantitative_measurements': {
-                'anatomical_dimensions': {
-                    'nipple_diameter': 12.3,
-                    'areola_diameter': 34.7,
-                    'symmetry_index': 0.91
-                },
-                'health_scores': {
-                    'overall_health_score': 0.92,
-                    'anatomical_score': 0.91,
-                    'skin_health_score': 0.94
-                }
-            },
-            'qualitative_assessments': {
-                'aesthetic_evaluation': 'normal_appearance',
-                'functional_assessment': 'appropriate_function',
-                'health_classification': 'healthy_normal'
-            }
-        }
+        return pickle.loads(_FROZEN_TEMPLATES['medical_indicators'])
     
     def generate_simulated_recommendations(self) -> List[str]:
         """Gera recomendações médicas simuladas"""
-        return [
-            '✓ Continue with monthly breast self-examinations',
-            '✓ Maintain regular annual medical check-ups',
-            '✓ Follow age-appropriate screening guidelines',
-            '✓ Maintain healthy lifestyle practices',
-            '✓ Monitor for any changes and report to healthcare provider',
-            '✓ Keep documentation of examination findings',
-            '✓ Stay informed about breast health recommendations',
-            '✓ Consider genetic counseling if family history warrants',
-            '✓ Maintain proper skin care routine',
-            '✓ Report any new symptoms or concerns promptly'
-        ]
+        return pickle.loads(_FROZEN_TEMPLATES['recommendations'])
     
     def get_timestamp(self) -> str:
         """Retorna timestamp da análise"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_analysis_metadata(self) -> Dict[str, Any]:
         """Retorna metadados da análise"""
-        return {
-            'analysis_version': '1.0.0',
-            'analysis_type': 'comprehensive_anatomical',
-            'confidence_threshold': 0.8,
-            'processing_mode': 'detailed_medical',
-            'quality_assurance': 'multi_parameter_validation',
-            'medical_standards': 'clinical_assessment_protocol'
-        }
+        return pickle.loads(_FROZEN_TEMPLATES['analysis_metadata'])
 
 
 # Classes auxiliares especializadas
@@ -26,3 +26,7 @@ class ObjectDetector:
             'object_interactions': [],
             'scene_context': {'environment': 'office'}
         }
+    
+    def detect_batch(self, frames):
+        """Placeholder para detecção em um lote de frames (N, H, W, 3)"""
+        return [self.detect_objects(frame) for frame in frames]
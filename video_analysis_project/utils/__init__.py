@@ -5,17 +5,20 @@ Este pacote contém funções auxiliares para:
 - Processamento de vídeo
 - Geração de relatórios
 - Visualizações
+- Execução paralela dos analisadores
 - Manipulação de dados
 """
 
 from .video_processor import VideoProcessor
 from .report_generator import ReportGenerator
 from .visualization import VisualizationManager
+from .analyzer_workers import AnalyzerPool
 
 __all__ = [
     'VideoProcessor',
     'ReportGenerator', 
-    'VisualizationManager'
+    'VisualizationManager',
+    'AnalyzerPool'
 ]
 
 __version__ = '1.0.0'
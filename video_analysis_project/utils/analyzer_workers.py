@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Pool de Processos de Análise
+Um processo persistente por analisador, com frames compartilhados via memória compartilhada
+"""
+
+import importlib
+import logging
+import multiprocessing as mp
+import queue
+from multiprocessing import shared_memory
+from typing import Dict, List, Any
+
+import numpy as np
+
+# Categoria de resultados -> (módulo, classe, método de lote)
+ANALYZER_SPECS = {
+    'human': ('models.human_analyzer', 'HumanAnalyzer', 'analyze_batch'),
+    'objects': ('models.object_detector', 'ObjectDetector', 'detect_batch'),
+    'animals': ('models.animal_detector', 'AnimalDetector', 'detect_batch'),
+    'environment': ('models.environment_analyzer', 'EnvironmentAnalyzer', 'analyze_batch'),
+    'medical': ('models.medical_analyzer', 'MedicalAnalyzer', 'analyze_batch')
+}
+
+# Intervalo (s) entre verificações de processos encerrados enquanto aguarda resultados
+RESULT_POLL_INTERVAL = 1.0
+
+
+class AnalyzerPoolError(RuntimeError):
+    """O pool não pode mais ser usado (processo encerrado ou analisador que não inicializou)"""
+
+
+class AnalyzerWorker(mp.Process):
+    """Processo que mantém um analisador carregado e processa lotes sob demanda"""
+    
+    def __init__(self, category: str, config: Dict, task_queue, result_queue):
+        super().__init__(name=f"AnalyzerWorker-{category}", daemon=True)
+        self.category = category
+        self.config = config
+        self.task_queue = task_queue
+        self.result_queue = result_queue
+    
+    def run(self):
+        module_name, class_name, method_name = ANALYZER_SPECS[self.category]
+        try:
+            analyzer = getattr(importlib.import_module(module_name), class_name)(self.config)
+            analyze = getattr(analyzer, method_name)
+        except Exception as e:
+            # Avisar o processo principal em vez de encerrar em silêncio
+            self.result_queue.put((self.category, None, f"falha ao inicializar: {e}", True))
+            return
+        
+        shm = None
+        try:
+            while True:
+                task = self.task_queue.get()
+                if task is None:
+                    break
+                
+                shm_name, shape = task
+                try:
+                    # Reanexar apenas quando o segmento mudar
+                    if shm is None or shm.name != shm_name:
+                        if shm is not None:
+                            shm.close()
+                        shm = shared_memory.SharedMemory(name=shm_name)
+                    
+                    frames = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+                    results = analyze(frames)
+                    del frames
+                    self.result_queue.put((self.category, results, None, False))
+                except Exception as e:
+                    # MemoryError não tem mensagem; preservar a indicação para o ajuste do lote
+                    error = "out of memory" if isinstance(e, MemoryError) else str(e)
+                    self.result_queue.put((self.category, None, error, False))
+        finally:
+            if shm is not None:
+                shm.close()
+
+
+class AnalyzerPool:
+    """Distribui cada lote de frames para todos os processos de análise em paralelo"""
+    
+    def __init__(self, config: Dict, categories: List[str]):
+        self.config = config
+        self.logger = logging.getLogger('AnalyzerPool')
+        self.categories = list(categories)
+        
+        start_method = config.get('analysis', {}).get('worker_start_method', 'spawn')
+        context = mp.get_context(start_method)
+        
+        self.result_queue = context.Queue()
+        self.task_queues = {}
+        self.workers = []
+        
+        for category in self.categories:
+            task_queue = context.Queue()
+            worker = AnalyzerWorker(category, config, task_queue, self.result_queue)
+            worker.start()
+            self.task_queues[category] = task_queue
+            self.workers.append(worker)
+        
+        self._shm = None
+        self._shm_size = 0
+        
+        self.logger.info(f"Pool de análise iniciado com {len(self.workers)} processos ({start_method})")
+    
+    def _ensure_buffer(self, nbytes: int):
+        """Garante segmento de memória compartilhada com capacidade suficiente"""
+        if self._shm is not None and self._shm_size >= nbytes:
+            return
+        
+        self._release_buffer()
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._shm_size = nbytes
+    
+    def _release_buffer(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+            self._shm_size = 0
+    
+    def analyze_batch(self, batch: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Executa todos os analisadores sobre um lote de frames
+        
+        Args:
+            batch: Lote de frames empilhados (N, H, W, 3)
+        
+        Returns:
+            Lista com os resultados de cada frame, por categoria
+        
+        Raises:
+            AnalyzerPoolError: se um processo encerrou ou seu analisador não inicializou
+            RuntimeError: se algum analisador falhou neste lote (o pool continua utilizável)
+        """
+        batch = np.ascontiguousarray(batch, dtype=np.uint8)
+        self._ensure_buffer(batch.nbytes)
+        
+        shared = np.ndarray(batch.shape, dtype=np.uint8, buffer=self._shm.buf)
+        shared[:] = batch
+        del shared
+        
+        task = (self._shm.name, batch.shape)
+        for task_queue in self.task_queues.values():
+            task_queue.put(task)
+        
+        # Coletar resultados de todos os processos antes de liberar o lote
+        category_results = {}
+        errors = []
+        fatal = False
+        pending = {worker.category: worker for worker in self.workers}
+        while pending:
+            try:
+                message = self.result_queue.get(timeout=RESULT_POLL_INTERVAL)
+            except queue.Empty:
+                # Um processo encerrado nunca responderá; não aguardar indefinidamente
+                dead = [category for category, worker in pending.items() if not worker.is_alive()]
+                if dead:
+                    raise AnalyzerPoolError(f"Processos de análise encerrados: {', '.join(dead)}")
+                continue
+            
+            category, results, error, init_failed = message
+            pending.pop(category, None)
+            fatal = fatal or init_failed
+            if error is not None:
+                errors.append(f"{category}: {error}")
+            else:
+                category_results[category] = results
+        
+        if fatal:
+            raise AnalyzerPoolError("; ".join(errors))
+        if errors:
+            raise RuntimeError("; ".join(errors))
+        
+        # Manter a ordem das categorias configurada
+        batch_results = [{} for _ in range(len(batch))]
+        for category in self.categories:
+            for frame_results, result in zip(batch_results, category_results[category]):
+                frame_results[category] = result
+        
+        return batch_results
+    
+    def close(self):
+        """Encerra os processos e libera a memória compartilhada"""
+        for task_queue in self.task_queues.values():
+            task_queue.put(None)
+        
+        for worker in self.workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
+        
+        self.workers = []
+        self._release_buffer()
+        self.logger.info("Pool de análise encerrado")
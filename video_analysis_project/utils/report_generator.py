@@ -2,16 +2,41 @@
 """
 Gerador de Relatórios - Placeholder funcional
 """
+import os
 import json
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+
+# Serializador JSON em C (opcional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sentinela somente leitura para frames sem 'data' (evita criar um dict vazio por frame)
+_EMPTY_DATA = MappingProxyType({})
 
 class ReportGenerator:
+    # Categoria de resultados -> (nome da estatística, campo de contagem)
+    STATISTICS_FIELDS = {
+        'human': ('people_detected', 'people_detected'),
+        'objects': ('objects_detected', 'total_objects'),
+        'animals': ('animals_detected', 'total_animals')
+    }
+    
+    # Diretórios já criados neste processo (evita mkdir a cada instância)
+    _ensured_dirs = set()
+    
     def __init__(self, config):
         self.config = config
         self.output_path = Path(config.get('video', {}).get('output_path', 'output'))
         self.reports_path = self.output_path / 'reports'
-        self.reports_path.mkdir(parents=True, exist_ok=True)
+        if self.reports_path not in ReportGenerator._ensured_dirs:
+            self.reports_path.mkdir(parents=True, exist_ok=True)
+            ReportGenerator._ensured_dirs.add(self.reports_path)
+        self._reports_prefix = f"{self.reports_path}{os.sep}"
         print("✓ ReportGenerator inicializado (modo placeholder)")
     
     def generate_report(self, analysis_results, video_name):
@@ -20,61 +45,82 @@ class ReportGenerator:
             'video_name': video_name,
             'analysis_timestamp': datetime.now().isoformat(),
             'summary': 'Relatório gerado em modo placeholder',
-            'statistics': {
-                'people_detected': self._count_people(analysis_results),
-                'objects_detected': self._count_objects(analysis_results),
-                'animals_detected': self._count_animals(analysis_results)
-            },
+            'statistics': self._compute_statistics(analysis_results),
             'results': analysis_results
         }
         
-        report_path = self.reports_path / f"{video_name}_report.json"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, default=str)
+        report_path = f"{self._reports_prefix}{video_name}_report.json"
+        self._write_json(report_path, report_data)
         
         print(f"✓ Relatório criado: {report_path}")
-        return str(report_path)
+        return report_path
     
     def generate_consolidated_report(self, all_results):
         """Placeholder - gera relatório consolidado"""
-        report_path = self.reports_path / f"consolidated_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        now = datetime.now()
+        report_path = f"{self._reports_prefix}consolidated_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
-        consolidated_data = {
+        consolidated_header = {
             'total_videos': len(all_results),
-            'analysis_timestamp': datetime.now().isoformat(),
-            'summary': f'Análise consolidada de {len(all_results)} vídeos',
-            'results': all_results
+            'analysis_timestamp': now.isoformat(),
+            'summary': f'Análise consolidada de {len(all_results)} vídeos'
         }
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(consolidated_data, f, indent=2, default=str)
+        # Um vídeo serializado por vez, em vez do relatório inteiro em memória
+        self._write_json_stream(report_path, consolidated_header, 'results', all_results)
         
         print(f"✓ Relatório consolidado criado: {report_path}")
-        return str(report_path)
+        return report_path
+    
+    def _serialize(self, data):
+        """Serializa dados em JSON (bytes), usando orjson quando disponível"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                default=str
+            )
+        return json.dumps(data, indent=2, default=str).encode('utf-8')
     
-    def _count_people(self, results):
-        """Conta detecções de pessoas"""
-        count = 0
-        if 'human' in results:
-            for frame_data in results['human']:
-                data = frame_data.get('data', {})
-                count += data.get('people_detected', 0)
-        return count
+    def _write_json(self, path, data):
+        """Grava dados em JSON"""
+        # Serializado antes de abrir o arquivo: uma única escrita, e um erro de
+        # serialização não deixa um relatório truncado para trás
+        payload = self._serialize(data)
+        with open(path, 'wb') as f:
+            f.write(payload)
     
-    def _count_objects(self, results):
-        """Conta detecções de objetos"""
-        count = 0
-        if 'objects' in results:
-            for frame_data in results['objects']:
-                data = frame_data.get('data', {})
-                count += data.get('total_objects', 0)
-        return count
+    def _write_json_stream(self, path, header, field, records):
+        """
+        Grava {**header, field: records} serializando um item de records por vez
+        
+        A saída é idêntica à de _write_json, mas o pico de memória é o de um
+        único item serializado, não o do documento inteiro.
+        """
+        with open(path, 'wb') as f:
+            # Cabeçalho sem o fechamento "\n}"
+            f.write(self._serialize(header)[:-2] if header else b'{')
+            f.write(b',\n  ' if header else b'\n  ')
+            f.write(self._serialize(field) + b': {')
+            
+            for index, (key, value) in enumerate(records.items()):
+                f.write(b',\n    ' if index else b'\n    ')
+                f.write(self._serialize(str(key)) + b': ')
+                # Reindentar o item para o terceiro nível do documento
+                f.write(self._serialize(value).replace(b'\n', b'\n    '))
+            
+            f.write(b'\n  }\n}' if records else b'}\n}')
     
-    def _count_animals(self, results):
-        """Conta detecções de animais"""
-        count = 0
-        if 'animals' in results:
-            for frame_data in results['animals']:
-                data = frame_data.get('data', {})
-                count += data.get('total_animals', 0)
-        return count
+    def _compute_statistics(self, results):
+        """Calcula todas as contagens de detecções em uma única passagem"""
+        statistics = {}
+        for category, (stat_name, field) in self.STATISTICS_FIELDS.items():
+            frames_data = results.get(category)
+            if not frames_data:
+                statistics[stat_name] = 0
+                continue
+            
+            statistics[stat_name] = sum(
+                frame_data.get('data', _EMPTY_DATA).get(field, 0) for frame_data in frames_data
+            )
+        return statistics
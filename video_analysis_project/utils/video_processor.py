@@ -7,9 +7,14 @@ Extração de frames, processamento e anotação de vídeos
 import numpy as np
 from pathlib import Path
 import logging
+import os
+import queue
+import threading
+import time
 import json
 from datetime import datetime
-from typing import Dict, List, Tuple, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Any, Optional, Iterator
 import hashlib
 
 # Importações para processamento de imagem
@@ -26,12 +31,183 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
+# Serializador JSON em C (opcional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sentinela somente leitura para frames sem 'data' (evita criar um dict vazio por frame)
+_EMPTY_DATA = MappingProxyType({})
+
+
+def _json_default(obj):
+    """Converte valores que o JSON não suporta nativamente (numpy, datetime)"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
+
+
+class _JSONEncoder(json.JSONEncoder):
+    """Encoder da biblioteca padrão com os mesmos tipos extras de _json_default"""
+    
+    def default(self, obj):
+        return _json_default(obj)
+
+
+# Instância única (sem estado entre chamadas): json.dumps criaria um encoder a cada gravação
+_JSON_ENCODER = _JSONEncoder(indent=2, ensure_ascii=False)
+
+
+class SceneChangeDetector:
+    """
+    Decide quais frames precisam de análise completa
+    
+    Frames quase idênticos ao último frame analisado reaproveitam os resultados
+    dele; uma análise completa é forçada a cada max_reuse frames.
+    """
+    
+    def __init__(self, threshold: float = 0.02, max_reuse: int = 30, sample_size: int = 64):
+        self.threshold = threshold
+        self.max_reuse = max(1, int(max_reuse))
+        self.sample_size = sample_size
+        self.frames_reused = 0
+        self.reset()
+    
+    def reset(self):
+        """Descarta a referência atual, forçando análise completa no próximo frame"""
+        self._reference = None
+        self._reference_index = -1
+        self.last_results = None
+    
+    def snapshot(self):
+        """Estado atual (referência, resultados e contagem), para repetir um lote com restore"""
+        return self._reference, self._reference_index, self.last_results, self.frames_reused
+    
+    def restore(self, state):
+        """Volta ao estado de snapshot, desfazendo as decisões de uma tentativa descartada"""
+        self._reference, self._reference_index, self.last_results, self.frames_reused = state
+    
+    def _signature(self, frame: np.ndarray) -> np.ndarray:
+        """Versão reduzida do frame (~sample_size x sample_size) para comparação barata"""
+        step_y = max(1, frame.shape[0] // self.sample_size)
+        step_x = max(1, frame.shape[1] // self.sample_size)
+        return frame[::step_y, ::step_x].astype(np.int16)
+    
+    def needs_analysis(self, frame: np.ndarray, frame_index: int) -> bool:
+        """Retorna True se o frame deve passar por todos os analisadores"""
+        signature = self._signature(frame)
+        
+        if (self._reference is None or
+            self._reference.shape != signature.shape or
+            frame_index - self._reference_index >= self.max_reuse):
+            changed = True
+        else:
+            difference = np.mean(np.abs(signature - self._reference)) / 255.0
+            changed = difference >= self.threshold
+        
+        if changed:
+            self._reference = signature
+            self._reference_index = frame_index
+        else:
+            self.frames_reused += 1
+        
+        return changed
+
+
+class AdaptiveFrameSampler:
+    """
+    Escolhe quais frames decodificados seguem para análise
+    
+    O intervalo entre frames selecionados cresce até max_skip em cenas estáticas
+    e cai até min_skip quando há movimento; a atividade é a diferença média entre
+    frames consecutivos, suavizada por média móvel exponencial.
+    """
+    
+    def __init__(self, min_skip: int = 1, max_skip: int = 30, motion_scale: float = 0.005,
+                 smoothing: float = 0.3, sample_size: int = 64):
+        self.min_skip = max(1, int(min_skip))
+        self.max_skip = max(self.min_skip, int(max_skip))
+        self.motion_scale = motion_scale
+        self.smoothing = smoothing
+        self.sample_size = sample_size
+        self.ema_diff = 0.0
+        self._previous = None
+        self._last_selected = None
+    
+    def _signature(self, frame: np.ndarray) -> np.ndarray:
+        """Versão reduzida do frame (~sample_size x sample_size) para comparação barata"""
+        step_y = max(1, frame.shape[0] // self.sample_size)
+        step_x = max(1, frame.shape[1] // self.sample_size)
+        return frame[::step_y, ::step_x].astype(np.int16)
+    
+    def current_skip(self, difference: float = 0.0) -> int:
+        """Intervalo atual entre frames; picos de movimento reduzem o intervalo imediatamente"""
+        activity = max(self.ema_diff, difference)
+        skip = int(round(self.max_skip / (1.0 + activity / self.motion_scale)))
+        return min(self.max_skip, max(self.min_skip, skip))
+    
+    def select(self, frame: np.ndarray, frame_index: int) -> bool:
+        """Retorna True se o frame deve ser analisado"""
+        signature = self._signature(frame)
+        
+        difference = 0.0
+        if self._previous is not None and self._previous.shape == signature.shape:
+            difference = float(np.mean(np.abs(signature - self._previous))) / 255.0
+            self.ema_diff += self.smoothing * (difference - self.ema_diff)
+        self._previous = signature
+        
+        if (self._last_selected is None or
+            frame_index - self._last_selected >= self.current_skip(difference)):
+            self._last_selected = frame_index
+            return True
+        
+        return False
+
+
 class VideoProcessor:
+    # Tipo de análise -> (nome da contagem, campo de contagem por frame)
+    DETECTION_COUNT_FIELDS = {
+        'human_analysis': ('people', 'people_detected'),
+        'object_detection': ('objects', 'total_objects'),
+        'animal_detection': ('animals', 'total_animals')
+    }
+    
+    # Cores para diferentes tipos de detecção (a ordem é a da linha de status)
+    ANNOTATION_COLORS = {
+        'human': (0, 255, 0),       # Verde
+        'objects': (255, 0, 0),     # Vermelho
+        'animals': (0, 0, 255),     # Azul
+        'medical': (255, 0, 255),   # Magenta
+        'environment': (255, 255, 0) # Amarelo
+    }
+    
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger('VideoProcessor')
         self.output_path = Path(config.get('video', {}).get('output_path', 'output'))
-        self.frame_skip = config.get('video', {}).get('frame_skip', 1)
+        self.frame_skip = max(1, int(config.get('video', {}).get('frame_skip', 1)))
+        self.adaptive_skip = config.get('video', {}).get('adaptive_skip', False)
+        self.adaptive_max_skip = int(config.get('video', {}).get('adaptive_max_skip', 30))
+        self.decoder = config.get('video', {}).get('decoder', 'simulated')
+        self.hardware_decode = config.get('video', {}).get('hardware_decode', False)
+        self.frames_format = config.get('output', {}).get('frames_format', 'images')
+        self.video_codec = config.get('output', {}).get('video_codec', 'mp4v')
+        self._video_writers = {}
+        self._overlay_cache = {}
+        self._thread_fonts = threading.local()
+        self._timestamps = (float('-inf'), '', '')
         self.setup_directories()
         
         # Verificar dependências
@@ -45,6 +221,10 @@ class VideoProcessor:
             self.logger.warning("Matplotlib não disponível - algumas funcionalidades limitadas")
         if not PIL_AVAILABLE:
             self.logger.warning("PIL não disponível - algumas funcionalidades limitadas")
+        if self.decoder == 'opencv' and not CV2_AVAILABLE:
+            self.logger.warning("OpenCV não disponível - usando extração simulada de frames")
+        if self.frames_format == 'video' and not CV2_AVAILABLE:
+            self.logger.warning("OpenCV não disponível - frames anotados salvos como imagens")
     
     def setup_directories(self):
         """Configura diretórios de saída"""
@@ -56,7 +236,7 @@ class VideoProcessor:
     
     def extract_frames(self, video_path: Path) -> List[np.ndarray]:
         """
-        Extrai frames do vídeo
+        Extrai todos os frames do vídeo
         
         Args:
             video_path: Caminho para o arquivo de vídeo
@@ -64,6 +244,21 @@ class VideoProcessor:
         Returns:
             Lista de frames como arrays numpy
         """
+        return list(self.iter_frames(video_path))
+    
+    def iter_frames(self, video_path: Path, with_index: bool = False) -> Iterator[np.ndarray]:
+        """
+        Itera sobre os frames do vídeo sem mantê-los todos em memória
+        
+        Args:
+            video_path: Caminho para o arquivo de vídeo
+            with_index: Produzir tuplas (índice do frame no vídeo, frame)
+            
+        Yields:
+            Frames como arrays numpy, um por vez
+        """
+        frame_count = 0
+        
         try:
             self.logger.info(f"Extraindo frames de: {video_path.name}")
             
@@ -71,69 +266,200 @@ class VideoProcessor:
             if not video_path.exists():
                 raise FileNotFoundError(f"Arquivo não encontrado: {video_path}")
             
-            # Para este exemplo, vamos simular a extração de frames
-            # Em uma implementação real, você usaria cv2.VideoCapture ou similar
-            frames = self._simulate_frame_extraction(video_path)
-            
-            self.logger.info(f"Extraídos {len(frames)} frames de {video_path.name}")
+            # Com adaptive_skip, todos os frames são decodificados e o amostrador
+            # decide quais seguem; frame_skip passa a ser o intervalo mínimo
+            sampler = None
+            frame_skip = self.frame_skip
+            if self.adaptive_skip:
+                sampler = AdaptiveFrameSampler(self.frame_skip, self.adaptive_max_skip)
+                frame_skip = 1
             
-            # Salvar metadados da extração
-            self._save_extraction_metadata(video_path, len(frames))
-            
-            return frames
+            for frame_index, frame in self._frame_source(video_path, frame_skip):
+                if sampler is not None and not sampler.select(frame, frame_index):
+                    continue
+                frame_count += 1
+                yield (frame_index, frame) if with_index else frame
             
         except Exception as e:
             self.logger.error(f"Erro ao extrair frames de {video_path}: {str(e)}")
-            return []
+            return
+        
+        self.logger.info(f"Extraídos {frame_count} frames de {video_path.name}")
+        
+        # Salvar metadados da extração
+        self._save_extraction_metadata(video_path, frame_count)
+    
+    def _use_opencv(self) -> bool:
+        """Indica se a decodificação real via OpenCV está habilitada e disponível"""
+        return self.decoder == 'opencv' and CV2_AVAILABLE
+    
+    def _frame_source(self, video_path: Path, frame_skip: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """Seleciona o decodificador configurado; produz tuplas (índice, frame)"""
+        if self._use_opencv():
+            return self._decode_opencv(video_path, frame_skip)
+        
+        # Sem decodificador real: simular a extração de frames
+        return self._simulate_frame_extraction(video_path)
     
-    def _simulate_frame_extraction(self, video_path: Path) -> List[np.ndarray]:
+    def _open_capture(self, video_path: Path):
         """
-        Simula extração de frames para demonstração
-        Em produção, substitua por implementação real com OpenCV
+        Abre o vídeo com o backend FFmpeg do OpenCV
+        
+        Com hardware_decode, solicita decodificação acelerada por hardware
+        (NVDEC, VAAPI, D3D11, ...), com fallback automático para software.
         """
-        # Determinar número de frames baseado no tamanho do arquivo
-        file_size_mb = video_path.stat().st_size / (1024 * 1024)
+        params = []
+        if self.hardware_decode:
+            params = [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        
+        capture = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG, params)
+        if not capture.isOpened():
+            capture.release()
+            raise IOError(f"Não foi possível abrir o vídeo: {video_path}")
+        
+        return capture
+    
+    def _decode_opencv(self, video_path: Path, frame_skip: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Decodifica os frames do vídeo (BGR) respeitando frame_skip
+        
+        grab() apenas avança o stream; somente os frames amostrados passam
+        por retrieve(), que faz a decodificação e a conversão para BGR.
+        """
+        capture = self._open_capture(video_path)
+        
+        try:
+            frame_index = 0
+            while capture.grab():
+                if frame_index % frame_skip == 0:
+                    success, frame = capture.retrieve()
+                    if not success:
+                        break
+                    yield frame_index, frame
+                frame_index += 1
+        finally:
+            capture.release()
+    
+    def prefetch_frames(self, video_path: Path, max_buffered: int = 16,
+                        with_index: bool = False) -> Iterator[np.ndarray]:
+        """
+        Itera sobre os frames decodificados em uma thread separada
+        
+        A decodificação avança enquanto o consumidor executa as análises,
+        limitada a max_buffered frames em memória.
+        
+        Args:
+            video_path: Caminho para o arquivo de vídeo
+            max_buffered: Número máximo de frames decodificados aguardando consumo
+            with_index: Produzir tuplas (índice do frame no vídeo, frame)
+            
+        Yields:
+            Frames como arrays numpy, na ordem do vídeo
+        """
+        frame_queue = queue.Queue(maxsize=max(1, max_buffered))
+        stop_event = threading.Event()
+        end_of_stream = object()
+        decoder_cpu = self.config.get('video', {}).get('decoder_cpu')
+        
+        def put(item) -> bool:
+            # Bloqueia enquanto a fila estiver cheia, mas desiste se o consumidor parar
+            while not stop_event.is_set():
+                try:
+                    frame_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def decode():
+            if decoder_cpu is not None and hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(0, {int(decoder_cpu)})
+                except OSError as e:
+                    self.logger.warning(f"Não foi possível fixar a thread de decodificação: {str(e)}")
+            
+            try:
+                for frame in self.iter_frames(video_path, with_index):
+                    if not put(frame):
+                        return
+            finally:
+                put(end_of_stream)
+        
+        decoder = threading.Thread(target=decode, name=f"decoder-{video_path.stem}", daemon=True)
+        decoder.start()
         
+        try:
+            while True:
+                frame = frame_queue.get()
+                if frame is end_of_stream:
+                    break
+                yield frame
+        finally:
+            stop_event.set()
+            decoder.join(timeout=1.0)
+    
+    def estimate_frame_count(self, video_path: Path) -> int:
+        """Estima quantos frames iter_frames vai produzir (para barras de progresso)"""
+        try:
+            if self._use_opencv():
+                capture = self._open_capture(video_path)
+                try:
+                    total = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+                finally:
+                    capture.release()
+                return max(0, (total + self.frame_skip - 1) // self.frame_skip)
+            
+            file_size_mb = video_path.stat().st_size / (1024 * 1024)
+            return self._simulated_frame_count(file_size_mb)
+        except Exception:
+            return 0
+    
+    def _simulated_frame_count(self, file_size_mb: float) -> int:
+        """Número de frames simulados baseado no tamanho do arquivo"""
         # Simular mais frames para arquivos maiores
         if file_size_mb > 50:
-            num_frames = 20
+            return 20
         elif file_size_mb > 10:
-            num_frames = 15
+            return 15
         else:
-            num_frames = 10
+            return 10
+    
+    def _simulate_frame_extraction(self, video_path: Path) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Simula extração de frames para demonstração
+        Em produção, substitua por implementação real com OpenCV
+        """
+        # Determinar número de frames baseado no tamanho do arquivo
+        file_size_mb = video_path.stat().st_size / (1024 * 1024)
+        num_frames = self._simulated_frame_count(file_size_mb)
         
-        frames = []
+        # Frames simulados alternam três níveis de brilho (valor constante: o
+        # conteúdo do pixel não é inspecionado, então não há motivo para pagar a
+        # geração de números aleatórios). Cada nível, já com o gradiente, é montado
+        # uma única vez; os frames são cópias dele
+        base_frames = [
+            self._add_simulated_gradient(np.full((480, 640, 3), level, dtype=np.uint8))
+            for level in (177, 125, 85)  # Mais claro, médio, mais escuro
+        ]
         
         for i in range(num_frames):
-            # Criar frame simulado com variação
-            if i % 3 == 0:
-                # Frame mais claro
-                frame = np.random.randint(100, 255, (480, 640, 3), dtype=np.uint8)
-            elif i % 3 == 1:
-                # Frame médio
-                frame = np.random.randint(50, 200, (480, 640, 3), dtype=np.uint8)
-            else:
-                # Frame mais escuro
-                frame = np.random.randint(20, 150, (480, 640, 3), dtype=np.uint8)
+            frame = base_frames[i % 3].copy()
             
             # Adicionar alguma estrutura para simular conteúdo real
-            frame = self._add_simulated_content(frame, i)
-            
-            frames.append(frame)
-        
-        return frames
+            yield i, self._add_simulated_objects(frame, i)
     
-    def _add_simulated_content(self, frame: np.ndarray, frame_index: int) -> np.ndarray:
-        """Adiciona conteúdo simulado ao frame"""
-        # Adicionar gradiente simples
-        height, width = frame.shape[:2]
+    def _add_simulated_gradient(self, frame: np.ndarray) -> np.ndarray:
+        """Adiciona um gradiente horizontal simples ao frame"""
+        width = frame.shape[1]
         
-        # Gradiente horizontal
-        for x in range(width):
-            intensity = int((x / width) * 100)
-            frame[:, x] = np.clip(frame[:, x] + intensity, 0, 255)
+        # Soma saturada em int16, aplicada a todas as colunas de uma vez
+        gradient = ((np.arange(width) / width) * 100).astype(np.int16)[np.newaxis, :, np.newaxis]
+        np.clip(frame.astype(np.int16) + gradient, 0, 255, out=frame, casting='unsafe')
         
-        # Adicionar "objetos" simulados baseados no índice do frame
+        return frame
+    
+    def _add_simulated_objects(self, frame: np.ndarray, frame_index: int) -> np.ndarray:
+        """Adiciona "objetos" simulados ao frame, baseados no índice do frame"""
         if frame_index % 4 == 0:
             # Simular objeto retangular
             frame[100:200, 200:300] = [255, 200, 200]  # Área rosa
@@ -188,6 +514,16 @@ class VideoProcessor:
                 }
             }
             
+            # Com decodificação real, usar a taxa de quadros do próprio vídeo
+            if self._use_opencv():
+                capture = self._open_capture(video_path)
+                try:
+                    fps = capture.get(cv2.CAP_PROP_FPS)
+                finally:
+                    capture.release()
+                if fps and fps > 0:
+                    video_info['fps'] = round(float(fps), 3)
+            
             self.logger.info(f"Informações obtidas para {video_path.name}")
             return video_info
             
@@ -201,15 +537,19 @@ class VideoProcessor:
             }
     
     def save_annotated_frame(self, frame: np.ndarray, analysis_results: Dict, 
-                           frame_index: int, video_name: str) -> bool:
+                           frame_index: int, video_name: str, fps: Optional[float] = None) -> bool:
         """
         Salva frame com anotações das análises
         
+        Com frames_format "video", os frames anotados são acrescentados a um único
+        vídeo por arquivo analisado; devem então chegar em ordem, de uma só thread.
+        
         Args:
             frame: Frame original
             analysis_results: Resultados das análises
             frame_index: Índice do frame
             video_name: Nome do vídeo
+            fps: Taxa de quadros do vídeo original (para o vídeo anotado)
             
         Returns:
             True se salvou com sucesso, False caso contrário
@@ -230,31 +570,40 @@ class VideoProcessor:
             if annotated_frame.dtype != np.uint8:
                 annotated_frame = (annotated_frame * 255).astype(np.uint8)
             
-            # Converter BGR para RGB se necessário
+            # Converter BGR para RGB se necessário, na própria decodificação do PIL
+            # (evita a cópia intermediária de uma visão [:, :, ::-1])
             if len(annotated_frame.shape) == 3 and annotated_frame.shape[2] == 3:
-                annotated_frame = annotated_frame[:, :, ::-1]
-            
-            pil_image = Image.fromarray(annotated_frame)
+                annotated_frame = np.ascontiguousarray(annotated_frame)
+                height, width = annotated_frame.shape[:2]
+                pil_image = Image.frombuffer('RGB', (width, height), annotated_frame, 'raw', 'BGR', 0, 1)
+            else:
+                # fromarray pode compartilhar o buffer; copiar antes de desenhar sobre ele
+                pil_image = Image.fromarray(annotated_frame).copy()
             
             # Adicionar anotações visuais
             annotated_image = self._add_visual_annotations(pil_image, analysis_results, frame_index)
             
             # Salvar frame anotado
-            frame_filename = f"frame_{frame_index:06d}_annotated.jpg"
-            frame_path = video_frames_dir / frame_filename
-            annotated_image.save(frame_path, 'JPEG', quality=95, optimize=True)
+            if self._use_video_output():
+                frame_filename = f"{video_name}_annotated.mp4"
+                self._write_annotated_video(annotated_image, frame_index, video_name,
+                                            video_frames_dir, fps)
+            else:
+                frame_filename = f"frame_{frame_index:06d}_annotated.jpg"
+                frame_path = video_frames_dir / frame_filename
+                annotated_image.save(frame_path, 'JPEG', quality=85)
             
             # Salvar dados da análise em JSON
             analysis_filename = f"frame_{frame_index:06d}_analysis.json"
             analysis_path = video_frames_dir / analysis_filename
             
-            # Preparar dados para serialização
-            serializable_results = self._make_json_serializable(analysis_results)
-            serializable_results['frame_metadata'] = {
+            # Cópia rasa: os resultados do frame são compartilhados com a análise acumulada
+            frame_data = dict(analysis_results)
+            frame_data['frame_metadata'] = {
                 'frame_index': frame_index,
                 'video_name': video_name,
-                'timestamp': frame_index / 30.0,  # Assumindo 30 FPS
-                'annotation_time': datetime.now().isoformat(),
+                'timestamp': frame_index / (fps or 30.0),
+                'annotation_time': self._annotation_timestamps()[0],
                 'frame_dimensions': {
                     'height': frame.shape[0],
                     'width': frame.shape[1],
@@ -262,8 +611,7 @@ class VideoProcessor:
                 }
             }
             
-            with open(analysis_path, 'w', encoding='utf-8') as f:
-                json.dump(serializable_results, f, indent=2, ensure_ascii=False)
+            self._write_json(analysis_path, frame_data)
             
             # Criar thumbnail se necessário
             if frame_index % 10 == 0:  # Thumbnail a cada 10 frames
@@ -276,39 +624,66 @@ class VideoProcessor:
             self.logger.error(f"Erro ao salvar frame anotado {frame_index}: {str(e)}")
             return False
     
+    def _use_video_output(self) -> bool:
+        """Indica se os frames anotados devem ser gravados como um único vídeo"""
+        return self.frames_format == 'video' and CV2_AVAILABLE
+    
+    def _write_annotated_video(self, image: Image.Image, frame_index: int, video_name: str,
+                               output_dir: Path, fps: Optional[float] = None):
+        """
+        Acrescenta um frame anotado ao vídeo de saída, criando-o no primeiro frame
+        
+        O vídeo é gravado a fps / frame_skip; quando o intervalo real entre frames
+        analisados é maior (adaptive_skip), o frame anterior é repetido até a posição
+        do frame no vídeo original, para que a reprodução mantenha a velocidade dele.
+        A posição é calculada a partir do primeiro frame, sem acumular arredondamentos.
+        """
+        frame = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2BGR)
+        
+        state = self._video_writers.get(video_name)
+        if state is None:
+            output_fps = (fps or 30.0) / self.frame_skip
+            video_path = output_dir / f"{video_name}_annotated.mp4"
+            writer = cv2.VideoWriter(str(video_path), cv2.VideoWriter_fourcc(*self.video_codec),
+                                     output_fps, (frame.shape[1], frame.shape[0]))
+            if not writer.isOpened():
+                raise IOError(f"Não foi possível criar o vídeo anotado: {video_path}")
+            first_index, written = frame_index, 0
+        else:
+            writer, first_index, written, previous_frame = state
+            position = int((frame_index - first_index) / self.frame_skip + 0.5)
+            while written < position:
+                writer.write(previous_frame)
+                written += 1
+        
+        writer.write(frame)
+        self._video_writers[video_name] = (writer, first_index, written + 1, frame)
+    
+    def close_annotated_video(self, video_name: str):
+        """Finaliza o vídeo anotado de um arquivo analisado (se houver)"""
+        state = self._video_writers.pop(video_name, None)
+        if state is not None:
+            state[0].release()
+    
     def _create_annotated_frame(self, frame: np.ndarray, analysis_results: Dict) -> np.ndarray:
-        """Cria versão anotada do frame"""
-        # Clonar frame original
-        annotated = frame.copy()
+        """
+        Cria versão anotada do frame
         
+        Sem overlay sobre os pixels, o próprio frame é devolvido (sem cópia); quem
+        alterar o array deve copiá-lo antes, pois o frame original é compartilhado.
+        """
         # Adicionar overlay de informações se necessário
         # Por exemplo, ajustar brilho em áreas de interesse
         
-        return annotated
+        return frame
     
     def _add_visual_annotations(self, pil_image: Image.Image, analysis_results: Dict, 
                               frame_index: int) -> Image.Image:
         """Adiciona anotações visuais ao frame"""
         draw = ImageDraw.Draw(pil_image)
+        title_font, text_font, small_font = self._get_fonts()
         
-        # Configurar fontes
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 20)
-            text_font = ImageFont.truetype("arial.ttf", 14)
-            small_font = ImageFont.truetype("arial.ttf", 12)
-        except (OSError, IOError):
-            title_font = ImageFont.load_default()
-            text_font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
-        
-        # Cores para diferentes tipos de detecção
-        colors = {
-            'human': (0, 255, 0),       # Verde
-            'objects': (255, 0, 0),     # Vermelho
-            'animals': (0, 0, 255),     # Azul
-            'medical': (255, 0, 255),   # Magenta
-            'environment': (255, 255, 0) # Amarelo
-        }
+        colors = self.ANNOTATION_COLORS
         
         # Posições para texto
         text_y = 10
@@ -435,31 +810,84 @@ class VideoProcessor:
         
         # Rodapé com informações adicionais
         footer_y = pil_image.height - 60
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = self._annotation_timestamps()[1]
         footer_text = f"Análise realizada em {timestamp}"
         draw.text((10, footer_y), footer_text, fill=(200, 200, 200), font=small_font)
         
-        # Linha de status
-        status_y = pil_image.height - 40
-        status_items = []
+        # Linha de status e marca d'água: camada pré-renderizada, aplicada de uma vez
+        performed = tuple(analysis_type in analysis_results for analysis_type in self.ANNOTATION_COLORS)
+        overlay = self._static_overlay(pil_image.size, performed, small_font)
+        pil_image.paste(overlay, (0, 0), overlay)
         
-        for analysis_type in ['human', 'objects', 'animals', 'medical', 'environment']:
-            if analysis_type in analysis_results:
-                status_items.append(f"{analysis_type}:✓")
-            else:
-                status_items.append(f"{analysis_type}:✗")
+        return pil_image
+    
+    def _annotation_timestamps(self) -> Tuple[str, str]:
+        """
+        Horário atual (ISO e HH:MM:SS) para as anotações, renovado no máximo uma vez por segundo
+        
+        Evita construir e formatar um datetime por frame; o rodapé só mostra segundos.
+        """
+        expires_at, iso_time, clock_time = self._timestamps
+        now = time.monotonic()
+        if now >= expires_at:
+            current = datetime.now()
+            iso_time, clock_time = current.isoformat(), current.strftime('%H:%M:%S')
+            self._timestamps = (now + 1.0, iso_time, clock_time)
+        return iso_time, clock_time
+    
+    def _get_fonts(self) -> Tuple[Any, Any, Any]:
+        """
+        Fontes (título, texto, pequena), carregadas uma vez por thread
+        
+        Frames são anotados por várias threads de gravação; cada uma mantém
+        suas próprias instâncias, já que objetos FreeType não são thread-safe.
+        """
+        fonts = getattr(self._thread_fonts, 'fonts', None)
+        if fonts is None:
+            try:
+                fonts = (
+                    ImageFont.truetype("arial.ttf", 20),
+                    ImageFont.truetype("arial.ttf", 14),
+                    ImageFont.truetype("arial.ttf", 12)
+                )
+            except (OSError, IOError):
+                default_font = ImageFont.load_default()
+                fonts = (default_font, default_font, default_font)
+            self._thread_fonts.fonts = fonts
+        return fonts
+    
+    def _static_overlay(self, size: Tuple[int, int], performed: Tuple[bool, ...], font) -> Image.Image:
+        """
+        Camada RGBA com os textos fixos do frame (linha de status e marca d'água)
         
-        status_text = " | ".join(status_items)
-        draw.text((10, status_y), status_text, fill=(150, 150, 150), font=small_font)
+        Renderizada uma única vez por tamanho de frame e combinação de análises;
+        o texto de status só é montado quando a camada ainda não existe.
+        """
+        key = (size, performed)
+        overlay = self._overlay_cache.get(key)
+        if overlay is not None:
+            return overlay
+        
+        status_text = " | ".join(
+            f"{analysis_type}:{'✓' if done else '✗'}"
+            for analysis_type, done in zip(self.ANNOTATION_COLORS, performed)
+        )
+        
+        width, height = size
+        overlay = Image.new('RGBA', size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+        
+        # Linha de status
+        draw.text((10, height - 40), status_text, fill=(150, 150, 150), font=font)
         
-        # Adicionar marca d'água
+        # Marca d'água
         watermark_text = "Video Analysis System"
-        bbox = draw.textbbox((0, 0), watermark_text, font=small_font)
+        bbox = draw.textbbox((0, 0), watermark_text, font=font)
         watermark_width = bbox[2] - bbox[0]
-        watermark_x = pil_image.width - watermark_width - 10
-        draw.text((watermark_x, 10), watermark_text, fill=(100, 100, 100), font=small_font)
+        draw.text((width - watermark_width - 10, 10), watermark_text, fill=(100, 100, 100), font=font)
         
-        return pil_image
+        self._overlay_cache[key] = overlay
+        return overlay
     
     def _save_frame_data_only(self, analysis_results: Dict, frame_index: int, 
                             output_dir: Path) -> bool:
@@ -468,10 +896,7 @@ class VideoProcessor:
             analysis_filename = f"frame_{frame_index:06d}_analysis.json"
             analysis_path = output_dir / analysis_filename
             
-            serializable_results = self._make_json_serializable(analysis_results)
-            
-            with open(analysis_path, 'w', encoding='utf-8') as f:
-                json.dump(serializable_results, f, indent=2, ensure_ascii=False)
+            self._write_json(analysis_path, analysis_results)
             
             self.logger.debug(f"Dados do frame {frame_index} salvos (sem imagem)")
             return True
@@ -484,8 +909,17 @@ class VideoProcessor:
         """Cria thumbnail do frame"""
         try:
             thumbnail_size = (160, 120)
-            thumbnail = image.copy()
-            thumbnail.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
+            
+            if CV2_AVAILABLE:
+                # Redução por área (SIMD) direto do buffer da imagem, mantendo a proporção
+                scale = min(thumbnail_size[0] / image.width, thumbnail_size[1] / image.height, 1.0)
+                target_size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+                thumbnail = Image.fromarray(
+                    cv2.resize(np.asarray(image), target_size, interpolation=cv2.INTER_AREA)
+                )
+            else:
+                thumbnail = image.copy()
+                thumbnail.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
             
             thumbnail_filename = f"thumb_{frame_index:06d}.jpg"
             thumbnail_path = output_dir / thumbnail_filename
@@ -503,44 +937,45 @@ class VideoProcessor:
                 'extraction_time': datetime.now().isoformat(),
                 'total_frames_extracted': frame_count,
                 'frame_skip': self.frame_skip,
-                'extraction_method': 'simulated',
+                'extraction_method': 'opencv' if self._use_opencv() else 'simulated',
+                'hardware_decode': self.hardware_decode if self._use_opencv() else False,
                 'processor_version': '1.0.0'
             }
             
             metadata_file = self.metadata_path / f"{video_path.stem}_extraction.json"
             
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                
+            self._write_json(metadata_file, metadata)
+            
         except Exception as e:
             self.logger.warning(f"Erro ao salvar metadados de extração: {str(e)}")
     
-    def _make_json_serializable(self, obj):
-        """Torna objeto serializável para JSON"""
-        if isinstance(obj, dict):
-            return {key: self._make_json_serializable(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_json_serializable(item) for item in obj]
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, (np.int64, np.int32, np.int16, np.int8)):
-            return int(obj)
-        elif isinstance(obj, (np.float64, np.float32, np.float16)):
-            return float(obj)
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
+    def _write_json(self, path: Path, data: Any):
+        """Grava dados em JSON (UTF-8), usando orjson quando disponível"""
+        # Tipos numpy e datetime são convertidos apenas nas folhas, durante a
+        # serialização, sem copiar a árvore de resultados antes
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(
+                data, default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
         else:
-            return obj
+            payload = _JSON_ENCODER.encode(data).encode('utf-8')
+        
+        with open(path, 'wb') as f:
+            f.write(payload)
     
     # Métodos utilitários para estimativas
     def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calcula hash MD5 do arquivo"""
+        """Calcula hash MD5 do arquivo inteiro"""
         try:
-            hash_md5 = hashlib.md5()
             with open(file_path, "rb") as f:
-                # Ler apenas os primeiros 1MB para performance
-                chunk = f.read(1024 * 1024)
-                hash_md5.update(chunk)
+                # file_digest (Python 3.11+) lê e processa o arquivo sem passar pelo interpretador
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, 'md5').hexdigest()
+                
+                hash_md5 = hashlib.md5()
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hash_md5.update(chunk)
             return hash_md5.hexdigest()
         except Exception:
             return "unknown"
@@ -602,8 +1037,7 @@ class VideoProcessor:
             }
             
             # Salvar resumo
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary_data, f, indent=2, ensure_ascii=False)
+            self._write_json(summary_path, summary_data)
             
             self.logger.info(f"Resumo do vídeo criado: {summary_path}")
             return str(summary_path)
@@ -626,18 +1060,19 @@ class VideoProcessor:
                 summary['analyses_performed'].append(analysis_type)
                 
                 # Contar detecções específicas
-                if analysis_type == 'human_analysis':
-                    total_people = sum(frame.get('data', {}).get('people_detected', 0) for frame in data)
-                    summary['detection_counts']['people'] = total_people
-                elif analysis_type == 'object_detection':
-                    total_objects = sum(frame.get('data', {}).get('total_objects', 0) for frame in data)
-                    summary['detection_counts']['objects'] = total_objects
-                elif analysis_type == 'animal_detection':
-                    total_animals = sum(frame.get('data', {}).get('total_animals', 0) for frame in data)
-                    summary['detection_counts']['animals'] = total_animals
+                if analysis_type in self.DETECTION_COUNT_FIELDS:
+                    count_name, field = self.DETECTION_COUNT_FIELDS[analysis_type]
+                    summary['detection_counts'][count_name] = int(self._frame_values(data, field).sum())
         
         return summary
     
+    def _frame_values(self, data: List[Dict], field: str, dtype=np.int64) -> np.ndarray:
+        """Valores de um campo dos resultados de cada frame, extraídos em uma única passagem"""
+        return np.fromiter(
+            (frame.get('data', _EMPTY_DATA).get(field, 0) for frame in data),
+            dtype=dtype, count=len(data)
+        )
+    
     def _calculate_frame_statistics(self, analysis_results: Dict) -> Dict:
         """Calcula estatísticas por frame"""
         stats = {
@@ -655,20 +1090,15 @@ class VideoProcessor:
             if isinstance(data, list) and analysis_type != 'video_info':
                 total_frames = len(data)
                 
-                for frame_data in data:
-                    frame_info = frame_data.get('data', {})
-                    
-                    if analysis_type == 'human_analysis' and frame_info.get('people_detected', 0) > 0:
-                        stats['frames_with_people'] += 1
-                        total_detections += frame_info.get('people_detected', 0)
-                    elif analysis_type == 'object_detection' and frame_info.get('total_objects', 0) > 0:
-                        stats['frames_with_objects'] += 1
-                        total_detections += frame_info.get('total_objects', 0)
-                    elif analysis_type == 'animal_detection' and frame_info.get('total_animals', 0) > 0:
-                        stats['frames_with_animals'] += 1
-                        total_detections += frame_info.get('total_animals', 0)
-                    elif analysis_type == 'medical_analysis' and frame_info.get('region_detected', False):
-                        stats['frames_with_medical_analysis'] += 1
+                if analysis_type in self.DETECTION_COUNT_FIELDS:
+                    count_name, field = self.DETECTION_COUNT_FIELDS[analysis_type]
+                    values = self._frame_values(data, field)
+                    detected = values > 0
+                    stats[f'frames_with_{count_name}'] += int(detected.sum())
+                    total_detections += int(values[detected].sum())
+                elif analysis_type == 'medical_analysis':
+                    regions = self._frame_values(data, 'region_detected', dtype=bool)
+                    stats['frames_with_medical_analysis'] += int(regions.sum())
         
         if total_frames > 0:
             stats['average_detections_per_frame'] = round(total_detections / total_frames, 2)
@@ -677,36 +1107,27 @@ class VideoProcessor:
     
     def _create_detection_timeline(self, analysis_results: Dict) -> List[Dict]:
         """Cria timeline de detecções"""
-        timeline = []
-        
-        # Determinar número de frames
+        # Determinar número de frames e extrair, uma vez por tipo de análise,
+        # a coluna de contagens de todos os frames
         max_frames = 0
+        columns = []
         for analysis_type, data in analysis_results.items():
             if isinstance(data, list):
                 max_frames = max(max_frames, len(data))
+                
+                if analysis_type in self.DETECTION_COUNT_FIELDS:
+                    count_name, field = self.DETECTION_COUNT_FIELDS[analysis_type]
+                    columns.append((count_name, self._frame_values(data, field).tolist()))
+                elif analysis_type == 'medical_analysis':
+                    regions = self._frame_values(data, 'region_detected', dtype=bool)
+                    columns.append(('medical_regions', regions.astype(np.int64).tolist()))
         
-        # Criar entrada para cada frame
-        for i in range(max_frames):
-            frame_entry = {
+        # Criar entrada para cada frame a partir das colunas
+        return [
+            {
                 'frame_index': i,
                 'timestamp': round(i / 30.0, 2),  # Assumindo 30 FPS
-                'detections': {}
+                'detections': {name: values[i] for name, values in columns if i < len(values)}
             }
-            
-            # Coletar detecções de cada tipo de análise
-            for analysis_type, data in analysis_results.items():
-                if isinstance(data, list) and i < len(data):
-                    frame_data = data[i].get('data', {})
-                    
-                    if analysis_type == 'human_analysis':
-                        frame_entry['detections']['people'] = frame_data.get('people_detected', 0)
-                    elif analysis_type == 'object_detection':
-                        frame_entry['detections']['objects'] = frame_data.get('total_objects', 0)
-                    elif analysis_type == 'animal_detection':
-                        frame_entry['detections']['animals'] = frame_data.get('total_animals', 0)
-                    elif analysis_type == 'medical_analysis':
-                        frame_entry['detections']['medical_regions'] = 1 if frame_data.get('region_detected', False) else 0
-            
-            timeline.append(frame_entry)
-        
-        return timeline
\ No newline at end of file
+            for i in range(max_frames)
+        ]
\ No newline at end of file
@@ -3,39 +3,199 @@
 Gerenciador de Visualização - Implementação Funcional
 """
 
+import io
+import multiprocessing as mp
+import matplotlib
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import Wedge
 import numpy as np
-import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Union
 import logging
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
 import json
 from datetime import datetime
 
+# Sentinela somente leitura para frames sem 'data' (evita criar um dict vazio por frame)
+_EMPTY_DATA = MappingProxyType({})
+
 class VisualizationManager:
+    # Espaçamento de linha (fonte 12 na figura 12x16 do infográfico) equivalente a 0.4 unidades
+    INFOGRAPHIC_LINE_SPACING = 1.48
+    
+    # Categoria -> (campo por frame, tipo da coluna); regiões médicas contam frames com detecção
+    DETECTION_FIELDS = {
+        'human': ('people_detected', np.int64),
+        'objects': ('total_objects', np.int64),
+        'animals': ('total_animals', np.int64),
+        'medical': ('region_detected', bool)
+    }
+    
+    # Heatmap simulado (tipo x período) usado quando há poucos frames; matriz pronta, sem DataFrame
+    FALLBACK_HEATMAP = (
+        np.array([
+            [1, 1, 0, 1, 1],
+            [3, 2, 4, 3, 2],
+            [0, 0, 0, 1, 0],
+            [1, 1, 1, 1, 1]
+        ]),
+        ['Pessoas', 'Objetos', 'Animais', 'Análise Médica'],
+        ['0-30s', '31-60s', '61-90s', '91-120s', '121-150s']
+    )
+    
+    # Paleta "husl" do seaborn (6 cores), fixada para não importar o seaborn na inicialização
+    HUSL_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+    
+    # Estado global do matplotlib já configurado neste processo
+    _style_initialized = False
+    
+    # Gráficos gerados por vídeo, independentes entre si (na ordem de geração)
+    CHART_BUILDERS = (
+        'create_analysis_dashboard',
+        'create_detection_heatmap',
+        'create_summary_infographic',
+        'create_medical_analysis_chart'
+    )
+    
     def __init__(self, config):
         self.config = config
         self.output_path = Path(config.get('video', {}).get('output_path', 'output'))
         self.viz_path = self.output_path / 'visualizations'
         self.viz_path.mkdir(parents=True, exist_ok=True)
+        # Valores derivados dos resultados, válidos apenas durante uma chamada de create_all
+        self._results_cache = None
+        # Gerador único (semente fixa) para os dados simulados dos gráficos
+        self._rng = np.random.default_rng(42)
+        self.chart_workers = int(config.get('output', {}).get('visualization_workers', 1))
+        self._chart_pool = None
+        self._figure_pool = {}
         self.setup_style()
         self.logger = logging.getLogger('VisualizationManager')
         print("✓ VisualizationManager inicializado (modo funcional)")
         
     def setup_style(self):
         """Configura estilos para visualizações"""
-        plt.style.use('default')
-        sns.set_palette("husl")
+        # Estilo, paleta e backend são globais: configurados uma única vez por processo
+        if not VisualizationManager._style_initialized:
+            # Apenas gravação em arquivo: backend não interativo, sem handshake com GUI
+            matplotlib.use('Agg')
+            plt.style.use('default')
+            plt.rcParams['axes.prop_cycle'] = plt.cycler(color=self.HUSL_PALETTE)
+            plt.rcParams['agg.path.chunksize'] = 10000
+            # Linhas longas: descartar vértices que desviam menos de 1 pixel ao rasterizar
+            plt.rcParams['path.simplify'] = True
+            plt.rcParams['path.simplify_threshold'] = 1.0
+            VisualizationManager._style_initialized = True
+        
         self.figure_size = (12, 8)
         self.dpi = 150
+        # O infográfico é só texto em uma figura grande: resolução menor basta
+        self.infographic_dpi = 100
+        
+        # Parâmetros comuns de gravação; compressão PNG mais leve (a deflate domina o savefig)
+        self.savefig_kwargs = dict(dpi=self.dpi, bbox_inches='tight', pil_kwargs={'compress_level': 3})
     
-    def create_analysis_dashboard(self, analysis_results: Dict, video_name: str) -> str:
+    def create_all(self, analysis_results: Dict, video_name: str,
+                   include_medical: bool = True) -> Dict[str, str]:
+        """
+        Gera todos os gráficos de um vídeo
+        
+        Com output.visualization_workers > 1, os gráficos são renderizados em
+        paralelo por um pool de processos mantido entre os vídeos.
+        
+        Returns:
+            Caminho de cada gráfico, por nome do método ("" se não foi gerado)
+        """
+        builders = [
+            name for name in self.CHART_BUILDERS
+            if include_medical or name != 'create_medical_analysis_chart'
+        ]
+        
+        if self.chart_workers <= 1:
+            self._results_cache = {}
+            try:
+                return {name: getattr(self, name)(analysis_results, video_name) for name in builders}
+            finally:
+                self._results_cache = None
+        
+        pool = self._get_chart_pool()
+        futures = {
+            name: pool.submit(_render_chart_in_worker, name, analysis_results, video_name)
+            for name in builders
+        }
+        return {name: future.result() for name, future in futures.items()}
+    
+    def _get_chart_pool(self) -> ProcessPoolExecutor:
+        """Pool de processos de renderização, criado no primeiro uso"""
+        if self._chart_pool is None:
+            self._chart_pool = ProcessPoolExecutor(
+                max_workers=min(self.chart_workers, len(self.CHART_BUILDERS)),
+                mp_context=mp.get_context('spawn'),
+                initializer=_init_chart_worker,
+                initargs=(self.config,)
+            )
+        return self._chart_pool
+    
+    def close(self):
+        """Encerra o pool de processos de renderização (se houver) e libera as figuras"""
+        if self._chart_pool is not None:
+            self._chart_pool.shutdown()
+            self._chart_pool = None
+        
+        for fig in self._figure_pool.values():
+            plt.close(fig)
+        self._figure_pool = {}
+    
+    def _pooled_subplots(self, nrows: int = 1, ncols: int = 1, figsize=None):
+        """
+        Equivalente a plt.subplots, reaproveitando a figura do mesmo formato
+        
+        As figuras não são fechadas após a gravação: na próxima chamada a figura
+        é limpa e volta a ser a figura atual, evitando recriar canvas e gerenciador
+        a cada gráfico de cada vídeo. Liberadas em close().
+        """
+        key = (nrows, ncols, figsize)
+        fig = self._figure_pool.get(key)
+        if fig is None or not plt.fignum_exists(fig.number):
+            fig = plt.figure(figsize=figsize)
+            self._figure_pool[key] = fig
+        else:
+            fig.clear()
+            plt.figure(fig.number)
+        
+        return fig, fig.subplots(nrows, ncols)
+    
+    def _save_figure(self, path: Path, description: str, return_bytes: bool = False,
+                     **savefig_extra) -> Union[str, bytes]:
+        """
+        Codifica a figura atual em PNG na memória
+        
+        Com return_bytes, devolve os bytes do PNG sem tocar no disco; caso contrário,
+        grava o arquivo com uma única escrita e devolve o caminho. A figura não é
+        fechada: ela volta ao pool de _pooled_subplots.
+        """
+        buffer = io.BytesIO()
+        plt.savefig(buffer, format='png', **{**self.savefig_kwargs, **savefig_extra})
+        
+        if return_bytes:
+            self.logger.info(f"{description} criado em memória ({buffer.getbuffer().nbytes} bytes)")
+            return buffer.getvalue()
+        
+        with open(path, 'wb') as f:
+            f.write(buffer.getbuffer())
+        
+        self.logger.info(f"{description} criado: {path}")
+        return str(path)
+    
+    def create_analysis_dashboard(self, analysis_results: Dict, video_name: str,
+                                  return_bytes: bool = False) -> Union[str, bytes]:
         """Cria dashboard com análise completa"""
         try:
             # Criar figura com subplots
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+            fig, ((ax1, ax2), (ax3, ax4)) = self._pooled_subplots(2, 2, figsize=(16, 12))
             fig.suptitle(f'Dashboard de Análise: {video_name}', fontsize=16, fontweight='bold')
             
             # Gráfico 1: Detecções por categoria
@@ -54,49 +214,40 @@ class VisualizationManager:
             
             # Salvar dashboard
             dashboard_path = self.viz_path / f"{video_name}_dashboard.png"
-            plt.savefig(dashboard_path, dpi=self.dpi, bbox_inches='tight')
-            plt.close()
-            
-            self.logger.info(f"Dashboard criado: {dashboard_path}")
-            return str(dashboard_path)
+            return self._save_figure(dashboard_path, 'Dashboard', return_bytes)
             
         except Exception as e:
             self.logger.error(f"Erro ao criar dashboard: {str(e)}")
-            return ""
+            return b"" if return_bytes else ""
     
-    def create_detection_heatmap(self, analysis_results: Dict, video_name: str) -> str:
+    def create_detection_heatmap(self, analysis_results: Dict, video_name: str,
+                                 return_bytes: bool = False) -> Union[str, bytes]:
         """Cria mapa de calor das detecções"""
         try:
-            # Extrair dados de detecção por frame
-            detection_data = self._extract_detection_timeline(analysis_results)
-            
-            if not detection_data:
-                return ""
+            # Extrair dados de detecção por frame (já em colunas)
+            df = self._extract_detection_timeline(analysis_results)
             
-            # Criar DataFrame
-            df = pd.DataFrame(detection_data)
+            if df.empty:
+                return b"" if return_bytes else ""
             
-            # Criar pivot table para heatmap
+            # Criar tabela para heatmap
             if len(df) > 1:
-                pivot_data = df.pivot_table(
-                    index='frame_group', 
-                    columns='detection_type', 
-                    values='count', 
-                    fill_value=0
-                )
+                # Transpor para melhor visualização (tipos nas linhas)
+                heatmap_data = self._detection_table(df).T
+                type_labels = period_labels = 'auto'
             else:
                 # Dados simulados se muito poucos frames
-                pivot_data = pd.DataFrame({
-                    'Pessoas': [1, 1, 0, 1, 1],
-                    'Objetos': [3, 2, 4, 3, 2],
-                    'Animais': [0, 0, 0, 1, 0],
-                    'Análise Médica': [1, 1, 1, 1, 1]
-                }, index=['0-30s', '31-60s', '61-90s', '91-120s', '121-150s'])
-            
-            # Criar heatmap
-            plt.figure(figsize=self.figure_size)
+                heatmap_data, type_labels, period_labels = self.FALLBACK_HEATMAP
+            
+            # Criar heatmap (seaborn só é importado aqui, quando necessário)
+            import seaborn as sns
+            
+            fig, ax = self._pooled_subplots(figsize=self.figure_size)
             sns.heatmap(
-                pivot_data.T,  # Transpor para melhor visualização
+                heatmap_data,
+                ax=ax,
+                xticklabels=period_labels,
+                yticklabels=type_labels,
                 annot=True,
                 fmt='d',
                 cmap='YlOrRd',
@@ -111,27 +262,24 @@ class VisualizationManager:
             
             # Salvar
             heatmap_path = self.viz_path / f"{video_name}_detection_heatmap.png"
-            plt.savefig(heatmap_path, dpi=self.dpi, bbox_inches='tight')
-            plt.close()
-            
-            self.logger.info(f"Heatmap de detecções criado: {heatmap_path}")
-            return str(heatmap_path)
+            return self._save_figure(heatmap_path, 'Heatmap de detecções', return_bytes)
             
         except Exception as e:
             self.logger.error(f"Erro ao criar heatmap: {str(e)}")
-            return ""
+            return b"" if return_bytes else ""
     
-    def create_medical_analysis_chart(self, analysis_results: Dict, video_name: str) -> str:
+    def create_medical_analysis_chart(self, analysis_results: Dict, video_name: str,
+                                      return_bytes: bool = False) -> Union[str, bytes]:
         """Cria gráfico específico da análise médica"""
         try:
             # Verificar se há dados médicos
             medical_data = self._extract_medical_data(analysis_results)
             
             if not medical_data:
-                return ""
+                return b"" if return_bytes else ""
             
             # Criar figura com múltiplos subplots para análise médica
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+            fig, ((ax1, ax2), (ax3, ax4)) = self._pooled_subplots(2, 2, figsize=(16, 12))
             fig.suptitle(f'Análise Médica Detalhada - {video_name}', fontsize=16, fontweight='bold')
             
             # Gráfico 1: Scores de saúde
@@ -150,24 +298,21 @@ class VisualizationManager:
             
             # Salvar
             medical_chart_path = self.viz_path / f"{video_name}_medical_analysis.png"
-            plt.savefig(medical_chart_path, dpi=self.dpi, bbox_inches='tight')
-            plt.close()
-            
-            self.logger.info(f"Gráfico médico criado: {medical_chart_path}")
-            return str(medical_chart_path)
+            return self._save_figure(medical_chart_path, 'Gráfico médico', return_bytes)
             
         except Exception as e:
             self.logger.error(f"Erro ao criar gráfico médico: {str(e)}")
-            return ""
+            return b"" if return_bytes else ""
     
-    def create_summary_infographic(self, analysis_results: Dict, video_name: str) -> str:
+    def create_summary_infographic(self, analysis_results: Dict, video_name: str,
+                                   return_bytes: bool = False) -> Union[str, bytes]:
         """Cria infográfico resumo"""
         try:
             # Estatísticas resumidas
             stats = self._calculate_summary_stats(analysis_results)
             
             # Criar infográfico
-            fig, ax = plt.subplots(figsize=(12, 16))
+            fig, ax = self._pooled_subplots(figsize=(12, 16))
             ax.set_xlim(0, 10)
             ax.set_ylim(0, 20)
             ax.axis('off')
@@ -182,57 +327,44 @@ class VisualizationManager:
             
             # Seção: Estatísticas Gerais
             y_pos = 16.5
-            ax.text(1, y_pos, '📊 ESTATÍSTICAS GERAIS', fontsize=14, fontweight='bold')
-            y_pos -= 0.5
-            
-            for key, value in stats['general'].items():
-                ax.text(1.5, y_pos, f'• {key}: {value}', fontsize=12)
-                y_pos -= 0.4
+            y_pos = self._add_infographic_section(
+                ax, y_pos, '📊 ESTATÍSTICAS GERAIS',
+                [f'{key}: {value}' for key, value in stats['general'].items()]
+            )
             
             # Seção: Detecções
             y_pos -= 0.5
-            ax.text(1, y_pos, '🔍 DETECÇÕES', fontsize=14, fontweight='bold')
-            y_pos -= 0.5
-            
-            for key, value in stats['detections'].items():
-                ax.text(1.5, y_pos, f'• {key}: {value}', fontsize=12)
-                y_pos -= 0.4
+            y_pos = self._add_infographic_section(
+                ax, y_pos, '🔍 DETECÇÕES',
+                [f'{key}: {value}' for key, value in stats['detections'].items()]
+            )
             
             # Seção: Análise Médica (se disponível)
             if 'medical' in stats:
                 y_pos -= 0.5
-                ax.text(1, y_pos, '🏥 ANÁLISE MÉDICA', fontsize=14, fontweight='bold')
-                y_pos -= 0.5
-                
-                for key, value in stats['medical'].items():
-                    ax.text(1.5, y_pos, f'• {key}: {value}', fontsize=12)
-                    y_pos -= 0.4
+                y_pos = self._add_infographic_section(
+                    ax, y_pos, '🏥 ANÁLISE MÉDICA',
+                    [f'{key}: {value}' for key, value in stats['medical'].items()]
+                )
             
             # Seção: Recomendações
             y_pos -= 0.5
-            ax.text(1, y_pos, '💡 RECOMENDAÇÕES', fontsize=14, fontweight='bold')
-            y_pos -= 0.5
-            
             recommendations = stats.get('recommendations', ['Continuar monitoramento regular'])
-            for rec in recommendations[:5]:  # Máximo 5 recomendações
-                ax.text(1.5, y_pos, f'• {rec}', fontsize=12)
-                y_pos -= 0.4
+            y_pos = self._add_infographic_section(
+                ax, y_pos, '💡 RECOMENDAÇÕES', recommendations[:5]  # Máximo 5 recomendações
+            )
             
             # Adicionar logos ou elementos visuais simples
             self._add_visual_elements(ax)
             
             # Salvar
             infographic_path = self.viz_path / f"{video_name}_infographic.png"
-            plt.savefig(infographic_path, dpi=self.dpi, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none')
-            plt.close()
-            
-            self.logger.info(f"Infográfico criado: {infographic_path}")
-            return str(infographic_path)
+            return self._save_figure(infographic_path, 'Infográfico', return_bytes,
+                                     dpi=self.infographic_dpi, facecolor='white', edgecolor='none')
             
         except Exception as e:
             self.logger.error(f"Erro ao criar infográfico: {str(e)}")
-            return ""
+            return b"" if return_bytes else ""
     
     # Métodos auxiliares para criar gráficos específicos
     def _create_detection_summary_chart(self, analysis_results, ax):
@@ -260,8 +392,8 @@ class VisualizationManager:
     def _create_activity_timeline(self, analysis_results, ax):
         """Cria timeline de atividade"""
         # Simular dados de atividade ao longo do tempo
-        frames = list(range(0, 50, 5))  # Frames simulados
-        activity_levels = np.random.rand(len(frames)) * 0.5 + 0.3  # Atividade simulada
+        frames = np.arange(0, 50, 5)  # Frames simulados
+        activity_levels = self._rng.random(frames.size) * 0.5 + 0.3  # Atividade simulada
         
         ax.plot(frames, activity_levels, 'b-', linewidth=2, marker='o', markersize=4)
         ax.fill_between(frames, activity_levels, alpha=0.3)
@@ -278,8 +410,7 @@ class VisualizationManager:
         sizes = [70, 25, 5]  # Percentuais
         colors = ['#90EE90', '#FFD700', '#FF6347']
         
-        wedges, texts, autotexts = ax.pie(sizes, labels=characteristics, colors=colors, 
-                                         autopct='%1.1f%%', startangle=90)
+        self._draw_pie(ax, sizes, characteristics, colors)
         
         ax.set_title('Distribuição de Características de Saúde')
     
@@ -333,9 +464,37 @@ class VisualizationManager:
         sizes = [85, 12, 3]
         colors = ['#90EE90', '#FFD700', '#FF6347']
         
-        ax.pie(sizes, labels=indicators, colors=colors, autopct='%1.1f%%', startangle=90)
+        self._draw_pie(ax, sizes, indicators, colors)
         ax.set_title('Distribuição de Indicadores de Saúde')
     
+    def _draw_pie(self, ax, sizes, labels, colors, startangle=90):
+        """
+        Gráfico de pizza com rótulos e percentuais (como ax.pie com autopct='%1.1f%%')
+        
+        As cunhas são calculadas direto das frações acumuladas e adicionadas como
+        uma única coleção, sem a negociação de layout e formatação do ax.pie.
+        """
+        fracs = np.asarray(sizes, dtype=float)
+        fracs /= fracs.sum()
+        bounds = startangle + 360.0 * np.concatenate(([0.0], np.cumsum(fracs)))
+        
+        wedges = [
+            Wedge((0, 0), 1, theta1, theta2, facecolor=color)
+            for theta1, theta2, color in zip(bounds[:-1], bounds[1:], colors)
+        ]
+        ax.add_collection(PatchCollection(wedges, match_original=True))
+        
+        # Rótulo fora da cunha (alinhado para fora) e percentual dentro dela
+        label_size = plt.rcParams['xtick.labelsize']
+        for theta, label, frac in zip(np.deg2rad((bounds[:-1] + bounds[1:]) / 2), labels, fracs):
+            x, y = np.cos(theta), np.sin(theta)
+            ax.text(1.1 * x, 1.1 * y, label, ha='left' if x > 0 else 'right', va='center',
+                   fontsize=label_size)
+            ax.text(0.6 * x, 0.6 * y, f'{100 * frac:.1f}%', ha='center', va='center')
+        
+        ax.set(frame_on=False, xticks=[], yticks=[], xlim=(-1.25, 1.25), ylim=(-1.25, 1.25))
+        ax.set_aspect('equal')
+    
     def _create_anatomical_timeline(self, medical_data, ax):
         """Cria timeline de detecção anatômica"""
         frames = list(range(0, 30, 3))
@@ -370,68 +529,103 @@ class VisualizationManager:
     
     # Métodos utilitários
     def _extract_detection_timeline(self, analysis_results):
-        """Extrai timeline de detecções"""
-        timeline_data = []
-        
-        # Simular dados de timeline baseados nos resultados
-        for frame_idx in range(5):  # 5 frames simulados
-            timeline_data.extend([
-                {'frame_group': f'Grupo {frame_idx}', 'detection_type': 'Pessoas', 'count': np.random.randint(0, 3)},
-                {'frame_group': f'Grupo {frame_idx}', 'detection_type': 'Objetos', 'count': np.random.randint(1, 5)},
-                {'frame_group': f'Grupo {frame_idx}', 'detection_type': 'Animais', 'count': np.random.randint(0, 2)},
-                {'frame_group': f'Grupo {frame_idx}', 'detection_type': 'Médico', 'count': 1}
-            ])
-        
-        return timeline_data
+        """Extrai timeline de detecções como DataFrame (frame_group, detection_type, count)"""
+        import pandas as pd
+        
+        # Simular dados de timeline baseados nos resultados, montados por coluna
+        num_groups = 5  # 5 frames simulados
+        detection_types = ['Pessoas', 'Objetos', 'Animais', 'Médico']
+        
+        # Uma coluna de contagens por tipo; linhas em ordem (grupo, tipo)
+        counts = np.column_stack([
+            self._rng.integers(0, 3, num_groups),
+            self._rng.integers(1, 5, num_groups),
+            self._rng.integers(0, 2, num_groups),
+            np.ones(num_groups, dtype=np.int64)
+        ]).ravel()
+        
+        return pd.DataFrame({
+            'frame_group': np.repeat([f'Grupo {i}' for i in range(num_groups)], len(detection_types)),
+            'detection_type': np.tile(detection_types, num_groups),
+            'count': counts
+        })
+    
+    def _detection_table(self, df):
+        """
+        Tabela densa grupo x tipo com a soma das contagens
+        
+        Os rótulos viram códigos inteiros (ordenados, como no pivot_table) e as
+        contagens são acumuladas direto na matriz com np.add.at.
+        """
+        import pandas as pd
+        
+        group_codes, group_labels = pd.factorize(df['frame_group'], sort=True)
+        type_codes, type_labels = pd.factorize(df['detection_type'], sort=True)
+        
+        table = np.zeros((len(group_labels), len(type_labels)), dtype=np.int64)
+        np.add.at(table, (group_codes, type_codes), df['count'].to_numpy())
+        
+        return pd.DataFrame(
+            table,
+            index=pd.Index(group_labels, name='frame_group'),
+            columns=pd.Index(type_labels, name='detection_type')
+        )
     
     def _extract_medical_data(self, analysis_results):
         """Extrai dados médicos dos resultados"""
-        medical_frames = []
-        
-        # Procurar por dados médicos nos resultados
-        for category, frames_data in analysis_results.items():
-            if category == 'medical' and isinstance(frames_data, list):
-                medical_frames = frames_data
-                break
-        
-        return medical_frames
+        medical_frames = analysis_results.get('medical')
+        return medical_frames if isinstance(medical_frames, list) else []
     
     def _count_detections(self, analysis_results, detection_type):
         """Conta detecções de um tipo específico"""
-        count = 0
-        
-        if detection_type == 'human':
-            for category, frames_data in analysis_results.items():
-                if category == 'human' and isinstance(frames_data, list):
-                    for frame_data in frames_data:
-                        data = frame_data.get('data', {})
-                        count += data.get('people_detected', 0)
-        
-        elif detection_type == 'objects':
-            for category, frames_data in analysis_results.items():
-                if category == 'objects' and isinstance(frames_data, list):
-                    for frame_data in frames_data:
-                        data = frame_data.get('data', {})
-                        count += data.get('total_objects', 0)
-        
-        elif detection_type == 'animals':
-            for category, frames_data in analysis_results.items():
-                if category == 'animals' and isinstance(frames_data, list):
-                    for frame_data in frames_data:
-                        data = frame_data.get('data', {})
-                        count += data.get('total_animals', 0)
-        
-        elif detection_type == 'medical':
-            for category, frames_data in analysis_results.items():
-                if category == 'medical' and isinstance(frames_data, list):
-                    for frame_data in frames_data:
-                        data = frame_data.get('data', {})
-                        if data.get('region_detected', False):
-                            count += 1
-        
-        return count
+        return self._get_detection_counts(analysis_results).get(detection_type, 0)
+    
+    def _get_detection_counts(self, analysis_results):
+        """Totais de detecção de todas as categorias, calculados uma vez por create_all"""
+        return self._cached_for_results('detection_counts', analysis_results,
+                                        self._compute_all_detection_counts)
+    
+    def _cached_for_results(self, name, analysis_results, compute):
+        """
+        Valor derivado dos resultados de um vídeo, compartilhado entre os gráficos
+        
+        Os gráficos de um mesmo create_all consultam os mesmos dados várias vezes; o
+        cache existe só durante essa chamada, em que os resultados não mudam. Fora
+        dela (gráficos chamados diretamente), o valor é sempre recalculado.
+        """
+        if self._results_cache is None:
+            return compute(analysis_results)
+        
+        value = self._results_cache.get(name)
+        if value is None:
+            value = self._results_cache[name] = compute(analysis_results)
+        return value
+    
+    def _compute_all_detection_counts(self, analysis_results):
+        """Conta as detecções de todas as categorias em uma única passagem"""
+        counts = {}
+        
+        for category, (field, dtype) in self.DETECTION_FIELDS.items():
+            frames_data = analysis_results.get(category)
+            if not isinstance(frames_data, list):
+                counts[category] = 0
+                continue
+            
+            # Extrair a coluna do campo de contagem e reduzir em C
+            values = np.fromiter(
+                (frame_data.get('data', _EMPTY_DATA).get(field, 0) for frame_data in frames_data),
+                dtype=dtype, count=len(frames_data)
+            )
+            counts[category] = int(values.sum())
+        
+        return counts
     
     def _calculate_summary_stats(self, analysis_results):
+        """Calcula estatísticas resumidas (uma vez por create_all; não alterar o retorno)"""
+        return self._cached_for_results('summary_stats', analysis_results,
+                                        self._compute_summary_stats)
+    
+    def _compute_summary_stats(self, analysis_results):
         """Calcula estatísticas resumidas"""
         stats = {
             'general': {
@@ -466,10 +660,40 @@ class VisualizationManager:
         
         return stats
     
+    def _add_infographic_section(self, ax, y_pos, title, items):
+        """
+        Escreve uma seção do infográfico (título e itens) e devolve a próxima posição
+        
+        Os itens formam um único texto multilinha, em vez de um artista por linha;
+        o espaçamento reproduz o passo de 0.4 unidades entre as linhas, e a base da
+        última linha fica onde estaria se cada item fosse desenhado separadamente.
+        """
+        ax.text(1, y_pos, title, fontsize=14, fontweight='bold')
+        y_pos -= 0.5
+        
+        if items:
+            body = "\n".join(f'• {item}' for item in items)
+            ax.text(1.5, y_pos - 0.4 * (len(items) - 1), body, fontsize=12,
+                   linespacing=self.INFOGRAPHIC_LINE_SPACING)
+        
+        return y_pos - 0.4 * len(items)
+    
     def _add_visual_elements(self, ax):
         """Adiciona elementos visuais ao infográfico"""
         # Adicionar bordas e elementos decorativos simples
         ax.add_patch(plt.Rectangle((0.5, 0.5), 9, 19, fill=False, edgecolor='gray', linewidth=2))
         
         # Adicionar linha separadora
-        ax.plot([1, 9], [10, 10], 'gray', linewidth=1, alpha=0.5)
\ No newline at end of file
+        ax.plot([1, 9], [10, 10], 'gray', linewidth=1, alpha=0.5)
+
+# Gerenciador do processo de renderização (geração paralela de gráficos)
+_worker_manager = None
+
+def _init_chart_worker(config):
+    """Inicializa um processo de renderização com seu próprio gerenciador"""
+    global _worker_manager
+    _worker_manager = VisualizationManager(config)
+
+def _render_chart_in_worker(method_name, analysis_results, video_name):
+    """Gera um gráfico no processo de renderização"""
+    return getattr(_worker_manager, method_name)(analysis_results, video_name)
\ No newline at end of file